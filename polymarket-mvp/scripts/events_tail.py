@@ -0,0 +1,171 @@
+"""Shared tail readers for the hourly cron scripts.
+
+events.jsonl is append-only and grows without bound, so the scripts only ever
+look at its tail. Lines are returned as raw bytes (newline stripped) and can be
+fed straight to ``loads`` without decoding.
+"""
+
+from __future__ import annotations
+
+import calendar
+import json
+import mmap
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    orjson = None
+
+
+def loads(line):
+    if orjson is None:
+        return json.loads(line)
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        # append_event writes with stdlib json, which emits NaN/Infinity that orjson rejects.
+        return json.loads(line)
+
+
+# Block size for the read()-based reverse scan used when mmap is unavailable.
+BLOCK_SIZE = 1 << 20
+
+
+def to_epoch(ts) -> Optional[float]:
+    """Epoch seconds for a numeric or ISO-8601 ``ts``; None if unparseable.
+
+    append_event writes ``YYYY-MM-DDTHH:MM:SS[.ffffff]+00:00`` (or ``Z``), which is
+    sliced directly; anything else goes through ``datetime.fromisoformat``.
+    """
+    if isinstance(ts, (int, float)):
+        return float(ts)
+    if not isinstance(ts, str):
+        return None
+    n = len(ts)
+    if n >= 20 and ts[10] == "T" and (ts.endswith("+00:00") or ts.endswith("Z")):
+        frac_end = n - 6 if ts[-1] == "0" else n - 1
+        try:
+            secs = calendar.timegm((
+                int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                int(ts[11:13]), int(ts[14:16]), int(ts[17:19]),
+            ))
+            if frac_end == 19:
+                return float(secs)
+            if frac_end == 26 and ts[19] == ".":
+                return (secs * 1_000_000 + int(ts[20:26])) / 1_000_000
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except Exception:
+        return None
+
+
+def iter_lines_reversed(path: Path, n: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Yield non-empty lines of ``path`` newest-first, at most ``n`` (0 = all).
+
+    ``end`` limits the scan to bytes before that offset (default: whole file).
+
+    Uses a reverse ``rfind`` scan over an mmap so only the pages holding the
+    tail are touched, and callers can stop early once they reach old events.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: mmap refuses zero-length mappings.
+            return
+        except OSError:
+            # Filesystem/platform without mmap support for this file.
+            yield from _iter_lines_reversed_blocks(path, n, end)
+            return
+        try:
+            left = n if n > 0 else -1
+            end = len(mm) if end is None else min(end, len(mm))
+            while end > 0 and left != 0:
+                nl = mm.rfind(b"\n", 0, end)
+                line = mm[nl + 1:end]
+                if line.strip():
+                    yield line
+                    left -= 1
+                end = nl if nl >= 0 else 0
+        finally:
+            mm.close()
+
+
+def _iter_lines_reversed_blocks(path: Path, n: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Same contract as iter_lines_reversed, reading BLOCK_SIZE chunks backwards."""
+    try:
+        # O_NOATIME skips the inode atime update, but needs file ownership.
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOATIME", 0))
+    except PermissionError:
+        fd = os.open(path, os.O_RDONLY)
+    with os.fdopen(fd, "rb", buffering=0) as f:
+        size = os.fstat(fd).st_size
+        pos = size if end is None else min(end, size)
+        left = n if n > 0 else -1
+        buf = bytearray(BLOCK_SIZE)
+        view = memoryview(buf)
+        carry = b""
+        while pos > 0:
+            take = min(BLOCK_SIZE, pos)
+            pos -= take
+            f.seek(pos)
+            got = f.readinto(view[:take]) or 0
+            parts = (bytes(view[:got]) + carry).split(b"\n")
+            # The first piece may continue into the previous block; hold it back.
+            carry = parts[0]
+            for line in reversed(parts[1:]):
+                if line.strip():
+                    yield line
+                    left -= 1
+                    if left == 0:
+                        return
+        if carry.strip():
+            yield carry
+
+
+def tail_lines(path: Path, n: int, end: Optional[int] = None) -> list[bytes]:
+    """Return the last ``n`` non-empty lines of ``path`` in file order."""
+    if n <= 0:
+        return []
+    out = list(iter_lines_reversed(path, n, end))
+    out.reverse()
+    return out
+
+
+def complete_end(path: Path, size: int) -> int:
+    """Offset just past the last newline within the first ``size`` bytes."""
+    with open(path, "rb") as f:
+        pos = size
+        while pos > 0:
+            start = max(0, pos - 65536)
+            f.seek(start)
+            i = f.read(pos - start).rfind(b"\n")
+            if i >= 0:
+                return start + i + 1
+            pos = start
+    return 0
+
+
+def iter_appended(path: Path, offset: int, end: int) -> Iterator[bytes]:
+    """Yield non-empty lines in bytes ``[offset, end)`` of ``path``, one at a time.
+
+    ``end`` should be a line boundary (see complete_end). Lines are streamed, so
+    memory stays flat however much was appended since ``offset``.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        left = end - offset
+        while left > 0:
+            line = f.readline(left)
+            if not line:
+                return
+            left -= len(line)
+            line = line.rstrip(b"\n")
+            if line.strip():
+                yield line
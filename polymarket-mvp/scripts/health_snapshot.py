@@ -9,12 +9,17 @@ Reads local dashboard JSON and prints compact, actionable status:
 
 from __future__ import annotations
 
-import json
+import atexit
 from datetime import datetime, timezone
-from urllib.request import urlopen
+
+import httpx
 
 URL = "http://127.0.0.1:8787/json"
 
+# Shared keep-alive client so repeated polls reuse one connection.
+CLIENT = httpx.Client(timeout=5.0)
+atexit.register(CLIENT.close)
+
 
 def parse_ts(ts: str | None) -> datetime | None:
     if not ts:
@@ -36,7 +41,9 @@ def fmt_age(v: float | None) -> str:
 
 
 def main() -> None:
-    payload = json.load(urlopen(URL, timeout=5))
+    r = CLIENT.get(URL)
+    r.raise_for_status()
+    payload = r.json()
     stats = payload.get("apiStats", {})
 
     latest_scan_ts = (stats.get("latestScan") or {}).get("ts")
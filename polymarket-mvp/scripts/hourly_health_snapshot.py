@@ -1,105 +1,190 @@
 #!/usr/bin/env python3
 import json
+import os
+import platform
+import re
 import subprocess
 import time
-from collections import Counter, deque
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
+from events_tail import complete_end, iter_appended, loads, tail_lines, to_epoch
+
 ROOT = Path(__file__).resolve().parents[1]
 EVENTS = ROOT / "data" / "events.jsonl"
 
+# Latest event kept per type for the summary lines.
+LAST_TYPES = frozenset({
+    "market_scan",
+    "inefficiency_report",
+    "weather_scan",
+    "ws_usage",
+    "market_groups",
+    "strategy_snapshot",
+})
+# Types counted by age window; everything else is skipped after the type check.
+ERROR_TYPES = frozenset({"loop_error", "adapter_error", "market_guardrail"})
+COUNTED_TYPES = ERROR_TYPES | {"btc_target_missing"}
+# Candidate signals passed over when picking the market_scan headline.
+SKIP_SIGNALS = frozenset({"NO_OPPORTUNITY", "NO_TRADE", "no_opportunity", "no_trade"})
+# Byte-level gate run before JSON parsing; accepts both compact and spaced separators.
+WANTED_RX = re.compile(
+    rb'"type":\s*"(?:' + b"|".join(re.escape(t.encode()) for t in sorted(LAST_TYPES | COUNTED_TYPES)) + rb')"'
+)
+LOOP_RX = re.compile(r"polymarket_mvp\.loop")
+DASH_RX = re.compile(r"polymarket_mvp\.dashboard")
+# Sidecar holding (inode, offset, aggregates) so each run only reads new bytes.
+STATE = EVENTS.with_name(EVENTS.name + ".hourly.state")
+# Past this much new data since the last run (missed runs, tick bursts) start over
+# from the capped tail instead of folding in everything appended.
+MAX_RESUME_BYTES = 64 << 20
+
+
+def ps_count(rx: re.Pattern) -> int:
+    if platform.system() != "Linux":
+        return _ps_count_shell(rx.pattern)
+    n = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmd = f.read().replace(b"\0", b" ")
+        except OSError:
+            continue
+        if rx.search(cmd.decode("utf-8", "ignore")):
+            n += 1
+    return n
+
 
-def ps_count(pattern: str) -> int:
+def _ps_count_shell(pattern: str) -> int:
     cmd = f"ps aux | egrep '{pattern}' | egrep -v 'egrep|grep' | wc -l"
     out = subprocess.check_output(cmd, shell=True, text=True).strip()
     return int(out or 0)
 
 
-def to_epoch(ts):
-    if isinstance(ts, (int, float)):
-        return float(ts)
-    if isinstance(ts, str):
-        try:
-            return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
-        except Exception:
-            return None
-    return None
-
-
 def age_minutes(ts):
+    # Measured against the run's single `now` rather than a fresh clock read per call.
     t = to_epoch(ts)
     if not t:
         return None
-    return round((time.time() - t) / 60.0, 1)
+    return round((now - t) / 60.0, 1)
 
 
-last = {}
-btc_target_missing_1h = 0
-btc_target_missing_30m = 0
-btc_target_missing_15m = 0
-btc_target_missing_5m = 0
-btc_target_missing_markets_1h = set()
-btc_target_missing_market_counter_1h = Counter()
-last_btc_target_missing_ts = None
-loop_errors_1h = 0
-adapter_errors_1h = 0
-guardrails_1h = 0
-now = time.time()
+def empty_aggregates() -> dict:
+    # Rolling state carried between cron runs: latest event per LAST_TYPES entry,
+    # plus timestamps of counted events inside the last hour.
+    return {
+        "last": {},
+        "btc_missing": [],
+        "last_btc_missing_ts": None,
+        "errors": {t: [] for t in ERROR_TYPES},
+    }
 
-if EVENTS.exists():
-    with EVENTS.open() as f:
-        # Keep this lightweight for hourly cron runs even when events.jsonl grows large.
-        # Tail a much larger window so high-frequency periods do not undercount
-        # within-hour diagnostics (e.g., btc_target_missing bursts).
-        recent_lines = deque(f, maxlen=100000)
-    for line in recent_lines:
+
+def load_aggregates(st: os.stat_result):
+    """Return (aggregates, offset) from the sidecar, or None if it does not match EVENTS."""
+    try:
+        state = json.loads(STATE.read_text())
+    except Exception:
+        return None
+    if state.get("inode") != st.st_ino or not 0 <= int(state.get("offset", -1)) <= st.st_size:
+        # Rotated or truncated log: fall back to a fresh tail scan.
+        return None
+    return state["aggregates"], int(state["offset"])
+
+
+def save_aggregates(st: os.stat_result, offset: int, agg: dict) -> None:
+    agg["btc_missing"] = [x for x in agg["btc_missing"] if now - x[0] <= 3600]
+    agg["errors"] = {t: [ts for ts in v if now - ts <= 3600] for t, v in agg["errors"].items()}
+    tmp = STATE.with_name(STATE.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps({"inode": st.st_ino, "offset": offset, "aggregates": agg}))
+        os.replace(tmp, STATE)
+    except OSError:
+        pass
+
+
+def fold_lines(agg: dict, lines) -> None:
+    for line in lines:
+        if not WANTED_RX.search(line):
+            continue
         try:
-            e = json.loads(line)
+            e = loads(line)
         except Exception:
             continue
 
-        ts = to_epoch(e.get("ts"))
         t = e.get("type")
+        if t in LAST_TYPES:
+            agg["last"][t] = e
+            continue
+        if t not in COUNTED_TYPES:
+            continue
 
-        if ts and now - ts <= 3600:
-            if t == "loop_error":
-                loop_errors_1h += 1
-            elif t == "adapter_error":
-                adapter_errors_1h += 1
-            elif t == "market_guardrail":
-                guardrails_1h += 1
-
-        if t in {
-            "market_scan",
-            "inefficiency_report",
-            "weather_scan",
-            "ws_usage",
-            "market_groups",
-            "strategy_snapshot",
-        }:
-            last[t] = e
+        ts = to_epoch(e.get("ts"))
+        if not ts:
+            continue
 
         if t == "btc_target_missing":
-            ts = to_epoch(e.get("ts"))
-            if ts:
-                if (last_btc_target_missing_ts is None) or ts > last_btc_target_missing_ts:
-                    last_btc_target_missing_ts = ts
-                if now - ts <= 3600:
-                    btc_target_missing_1h += 1
-                    if now - ts <= 1800:
-                        btc_target_missing_30m += 1
-                    if now - ts <= 900:
-                        btc_target_missing_15m += 1
-                    if now - ts <= 300:
-                        btc_target_missing_5m += 1
-                    mid = str(e.get("market_id") or "")
-                    if mid:
-                        btc_target_missing_markets_1h.add(mid)
-                        btc_target_missing_market_counter_1h[mid] += 1
-
-loop_n = ps_count(r"polymarket_mvp\.loop")
-dash_n = ps_count(r"polymarket_mvp\.dashboard")
+            last_ts = agg["last_btc_missing_ts"]
+            if (last_ts is None) or ts > last_ts:
+                agg["last_btc_missing_ts"] = ts
+            if now - ts <= 3600:
+                agg["btc_missing"].append([ts, str(e.get("market_id") or "")])
+        elif now - ts <= 3600:
+            agg["errors"][t].append(ts)
+
+
+now = time.time()
+agg = empty_aggregates()
+
+if EVENTS.exists():
+    st = os.stat(EVENTS)
+    resumed = load_aggregates(st)
+    if resumed is not None and st.st_size - resumed[1] <= MAX_RESUME_BYTES:
+        # Only fold in what was appended since the previous run.
+        agg, start = resumed
+        offset = max(start, complete_end(EVENTS, st.st_size))
+        lines = iter_appended(EVENTS, start, offset)
+    else:
+        # Keep this lightweight for hourly cron runs even when events.jsonl grows large.
+        # Tail a much larger window so high-frequency periods do not undercount
+        # within-hour diagnostics (e.g., btc_target_missing bursts).
+        offset = complete_end(EVENTS, st.st_size)
+        lines = tail_lines(EVENTS, 100000, end=offset)
+    fold_lines(agg, lines)
+    save_aggregates(st, offset, agg)
+
+last = agg["last"]
+last_btc_target_missing_ts = agg["last_btc_missing_ts"]
+btc_target_missing_1h = 0
+btc_target_missing_30m = 0
+btc_target_missing_15m = 0
+btc_target_missing_5m = 0
+btc_target_missing_markets_1h = set()
+btc_target_missing_market_counter_1h = Counter()
+for ts, mid in agg["btc_missing"]:
+    age = now - ts
+    if age > 3600:
+        continue
+    btc_target_missing_1h += 1
+    if age <= 1800:
+        btc_target_missing_30m += 1
+    if age <= 900:
+        btc_target_missing_15m += 1
+    if age <= 300:
+        btc_target_missing_5m += 1
+    if mid:
+        btc_target_missing_markets_1h.add(mid)
+        btc_target_missing_market_counter_1h[mid] += 1
+errors_1h = {t: sum(1 for ts in v if now - ts <= 3600) for t, v in agg["errors"].items()}
+loop_errors_1h = errors_1h["loop_error"]
+adapter_errors_1h = errors_1h["adapter_error"]
+guardrails_1h = errors_1h["market_guardrail"]
+
+loop_n = ps_count(LOOP_RX)
+dash_n = ps_count(DASH_RX)
 
 print(f"loops={loop_n} dashboards={dash_n}")
 if loop_n == 1 and dash_n == 1:
@@ -111,7 +196,7 @@ ms = last.get("market_scan", {})
 if ms:
     cands = ms.get("top_candidates") or []
     c = next(
-        (x for x in cands if (x.get("signal") or "").upper() not in {"NO_OPPORTUNITY", "NO_TRADE"}),
+        (x for x in cands if x.get("signal") not in SKIP_SIGNALS),
         cands[0] if cands else {},
     )
     age = age_minutes(ms.get("ts"))
@@ -159,10 +244,11 @@ grp = last.get("market_groups", {})
 if grp:
     btc = (grp.get("bitcoin") or [{}])[0]
     if btc:
+        age = age_minutes(grp.get("ts"))
         print(
             "btc_focus",
             grp.get("ts"),
-            f"age_min={age_minutes(grp.get('ts'))}",
+            f"age_min={age}",
             btc.get("market_id"),
             btc.get("signal"),
             f"model={btc.get('best_model')}",
@@ -171,10 +257,11 @@ if grp:
 
 snap = last.get("strategy_snapshot", {})
 if snap:
+    age = age_minutes(snap.get("ts"))
     print(
         "strategy",
         snap.get("ts"),
-        f"age_min={age_minutes(snap.get('ts'))}",
+        f"age_min={age}",
         snap.get("market_id"),
         snap.get("winner_side"),
         f"open_positions={snap.get('open_positions')}",
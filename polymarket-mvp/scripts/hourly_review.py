@@ -1,27 +1,18 @@
 #!/usr/bin/env python3
 import argparse
+import bisect
 import json
 import time
-from collections import Counter, defaultdict, deque
-from datetime import datetime
+from collections import Counter, defaultdict
 from pathlib import Path
 
+from events_tail import iter_lines_reversed, loads, to_epoch
+
 EVENTS = Path(__file__).resolve().parents[1] / "data" / "events.jsonl"
 WINDOW_S = 3600
 RECENT_LINES = 300_000
 
 
-def to_epoch(v):
-    if isinstance(v, (int, float)):
-        return float(v)
-    if isinstance(v, str):
-        try:
-            return datetime.fromisoformat(v.replace("Z", "+00:00")).timestamp()
-        except Exception:
-            return None
-    return None
-
-
 def parse_args():
     p = argparse.ArgumentParser(description="Summarize recent paper trading performance from events.jsonl")
     p.add_argument("--window-hours", type=float, default=1.0, help="Lookback window in hours (default: 1)")
@@ -35,19 +26,6 @@ def parse_args():
     return p.parse_args()
 
 
-def iter_recent_lines(path: Path, recent_lines: int):
-    if recent_lines <= 0:
-        with path.open() as f:
-            yield from f
-        return
-    q = deque(maxlen=recent_lines)
-    with path.open() as f:
-        for line in f:
-            q.append(line)
-    for line in q:
-        yield line
-
-
 def main():
     args = parse_args()
     now = time.time()
@@ -55,14 +33,23 @@ def main():
     cut = now - window_s
     opens, closes, partial_closes, guards = [], [], [], []
 
-    for line in iter_recent_lines(args.events, args.recent_lines):
+    # events.jsonl is appended in time order: walk it newest-first and stop at
+    # the first event older than the window. Only trade/guardrail lines matter,
+    # so skip everything else before paying for a JSON parse.
+    for line in iter_lines_reversed(args.events, args.recent_lines):
+        if b'"paper_trade"' not in line and b'"market_guardrail"' not in line:
+            continue
+        if b'"ts"' not in line:
+            continue
         try:
-            e = json.loads(line)
+            e = loads(line)
         except Exception:
             continue
         t = to_epoch(e.get("ts"))
-        if not t or t < cut:
+        if not t:
             continue
+        if t < cut:
+            break
         typ = e.get("type")
         if typ == "paper_trade":
             action = str(e.get("action") or "")
@@ -74,68 +61,80 @@ def main():
                 partial_closes.append(e)
         elif typ == "market_guardrail":
             guards.append(e)
-
-    pnl = sum(float(e.get("pnl_usd") or 0.0) for e in closes)
-    wins = sum(1 for e in closes if float(e.get("pnl_usd") or 0.0) > 0)
-    breakeven = sum(1 for e in closes if float(e.get("pnl_usd") or 0.0) == 0)
-    losses = sum(1 for e in closes if float(e.get("pnl_usd") or 0.0) < 0)
-    winrate = (wins / len(closes) * 100.0) if closes else 0.0
-
-    by_side = Counter((e.get("side") or "-") for e in closes)
-    by_model = Counter((e.get("model_open") or e.get("model") or "-") for e in closes)
-    close_reasons = Counter((e.get("reason") or "-") for e in closes)
-
+    for lst in (opens, closes, partial_closes, guards):
+        lst.reverse()
+
+    pnl = 0.0
+    wins = breakeven = losses = 0
+    by_side = Counter()
+    by_model = Counter()
+    close_reasons = Counter()
     side_pnl = defaultdict(float)
     model_pnl = defaultdict(float)
     reason_pnl = defaultdict(float)
     model_wins = defaultdict(int)
-    model_trades = defaultdict(int)
+    closes_by_market = defaultdict(list)
+    closes_per_market = Counter()
+    hold_sum = 0.0
+    hold_n = 0
+    # One pass over closes feeds every per-close aggregate below.
     for e in closes:
         v = float(e.get("pnl_usd") or 0.0)
         side = (e.get("side") or "-")
         model = (e.get("model_open") or e.get("model") or "-")
         reason = (e.get("reason") or "-")
+        pnl += v
+        if v > 0:
+            wins += 1
+            model_wins[model] += 1
+        elif v < 0:
+            losses += 1
+        else:
+            breakeven += 1
+        by_side[side] += 1
+        by_model[model] += 1
+        close_reasons[reason] += 1
         side_pnl[side] += v
         model_pnl[model] += v
         reason_pnl[reason] += v
-        model_trades[model] += 1
-        if v > 0:
-            model_wins[model] += 1
+
+        raw_mid = e.get("market_id")
+        ct = to_epoch(e.get("closed_at") or e.get("ts"))
+        if ct:
+            closes_by_market[str(raw_mid or "")].append(ct)
+        if raw_mid is not None:
+            closes_per_market[str(raw_mid or "")] += 1
+        ot = to_epoch(e.get("opened_at"))
+        if ot and ct and ct >= ot:
+            hold_sum += ct - ot
+            hold_n += 1
+    winrate = (wins / len(closes) * 100.0) if closes else 0.0
 
     # Re-entry / churn: open after close on same market within 10 minutes.
-    closes_by_market = defaultdict(list)
-    for e in closes:
-        ts = to_epoch(e.get("closed_at") or e.get("ts"))
-        if ts:
-            closes_by_market[str(e.get("market_id") or "")].append(ts)
     for v in closes_by_market.values():
         v.sort()
 
     reentries = 0
     fast_reentries = 0
-    hold_s = []
-    closes_per_market = Counter(str(e.get("market_id") or "") for e in closes if e.get("market_id") is not None)
     partials_per_market = Counter(str(e.get("market_id") or "") for e in partial_closes if e.get("market_id") is not None)
     for e in opens:
         mid = str(e.get("market_id") or "")
         ot = to_epoch(e.get("opened_at") or e.get("ts"))
         if not mid or not ot:
             continue
-        prev = [x for x in closes_by_market.get(mid, []) if x < ot]
-        if prev:
-            dt = ot - prev[-1]
-            if dt <= 600:
-                reentries += 1
-            if dt <= 180:
-                fast_reentries += 1
-
-    for e in closes:
-        ot = to_epoch(e.get("opened_at"))
-        ct = to_epoch(e.get("closed_at") or e.get("ts"))
-        if ot and ct and ct >= ot:
-            hold_s.append(ct - ot)
+        times = closes_by_market.get(mid)
+        if not times:
+            continue
+        i = bisect.bisect_left(times, ot) - 1
+        if i < 0:
+            continue
+        dt = ot - times[i]
+        if dt <= 600:
+            reentries += 1
+        if dt <= 180:
+            fast_reentries += 1
 
-    avg_hold = (sum(hold_s) / len(hold_s)) if hold_s else 0.0
+    avg_hold = (hold_sum / hold_n) if hold_n else 0.0
 
     out = {
         "window_minutes": round(window_s / 60.0, 2),
@@ -150,7 +149,7 @@ def main():
         "by_model": dict(by_model),
         "by_model_pnl": {k: round(v, 4) for k, v in model_pnl.items()},
         "by_model_winrate_pct": {
-            k: round((model_wins.get(k, 0) / max(1, n)) * 100.0, 2) for k, n in model_trades.items()
+            k: round((model_wins.get(k, 0) / max(1, n)) * 100.0, 2) for k, n in by_model.items()
         },
         "close_reasons": dict(close_reasons),
         "close_reasons_pnl": {k: round(v, 4) for k, v in reason_pnl.items()},
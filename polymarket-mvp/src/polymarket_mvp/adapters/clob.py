@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 import httpx
 
 from polymarket_mvp.models import MarketSnapshot
@@ -7,59 +8,103 @@ from polymarket_mvp.adapters.gamma import GammaMarketRef
 
 
 class ClobAdapter:
-    def __init__(self, base_url: str):
+    """CLOB REST reader.
+
+    Holds one pooled AsyncClient (and the private event loop it lives on) for the
+    adapter's lifetime, so book fetches reuse keep-alive connections across
+    cycles. Call close() or use it as a context manager when done.
+    """
+
+    def __init__(self, base_url: str, max_concurrency: int = 16, books_batch_size: int = 50):
         self.base_url = base_url.rstrip("/")
         self.call_count = 0
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.books_batch_size = max(1, int(books_batch_size))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
 
     def reset_call_count(self):
         self.call_count = 0
 
-    def _fetch_book(self, token_id: str) -> Optional[dict]:
-        url = f"{self.base_url}/book"
-        with httpx.Client(timeout=15.0) as client:
+    def __enter__(self) -> "ClobAdapter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._run(self._client.aclose())
+            self._client = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def _run(self, coro):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            )
+            self._client = httpx.AsyncClient(timeout=15.0, limits=limits)
+        return self._client
+
+    async def _fetch_book(self, sem: asyncio.Semaphore, token_id: str) -> Optional[dict]:
+        async with sem:
             self.call_count += 1
-            r = client.get(url, params={"token_id": token_id})
+            r = await self._get_client().get(f"{self.base_url}/book", params={"token_id": token_id})
             if r.status_code != 200:
                 return None
             return r.json()
 
+    async def _fetch_books(self, sem: asyncio.Semaphore, token_ids: List[str]) -> Dict[str, dict]:
+        # One POST /books for many tokens; falls back to per-token /book if the bulk call is refused.
+        async with sem:
+            self.call_count += 1
+            r = await self._get_client().post(f"{self.base_url}/books", json=[{"token_id": t} for t in token_ids])
+        if r.status_code != 200:
+            books = await asyncio.gather(*[self._fetch_book(sem, t) for t in token_ids])
+            return {t: b for t, b in zip(token_ids, books) if b}
+        out: Dict[str, dict] = {}
+        for b in r.json() or []:
+            if isinstance(b, dict) and b.get("asset_id"):
+                out[str(b["asset_id"])] = b
+        return out
+
     @staticmethod
-    def _best_ask(levels: list) -> float:
-        if not levels:
-            return 0.0
-        vals = []
-        for lvl in levels:
+    def _to_levels(levels: list) -> List[Tuple[float, float]]:
+        # Parse a book side once into (price, size) pairs; unparseable fields become 0.0
+        # so they drop out of best-price and depth math the same way the raw walk did.
+        out: List[Tuple[float, float]] = []
+        for lvl in levels or []:
+            lvl = lvl or {}
             try:
-                px = float((lvl or {}).get("price", 0.0))
-                if px > 0:
-                    vals.append(px)
+                px = float(lvl.get("price", 0.0))
             except Exception:
-                continue
-        return min(vals) if vals else 0.0
-
-    @staticmethod
-    def _best_bid(levels: list) -> float:
-        if not levels:
-            return 0.0
-        vals = []
-        for lvl in levels:
+                px = 0.0
             try:
-                px = float((lvl or {}).get("price", 0.0))
-                if px > 0:
-                    vals.append(px)
+                sz = float(lvl.get("size", 0.0))
             except Exception:
-                continue
-        return max(vals) if vals else 0.0
+                sz = 0.0
+            out.append((px, sz))
+        return out
 
     @staticmethod
-    def _depth_usd(levels: list, depth_n: int = 5) -> float:
-        total = 0.0
-        for lvl in levels[:depth_n]:
-            try:
-                total += float(lvl.get("price", 0.0)) * float(lvl.get("size", 0.0))
-            except Exception:
-                continue
-        return total
+    def _best_ask(levels: List[Tuple[float, float]]) -> float:
+        return min((px for px, _ in levels if px > 0), default=0.0)
+
+    @staticmethod
+    def _best_bid(levels: List[Tuple[float, float]]) -> float:
+        return max((px for px, _ in levels if px > 0), default=0.0)
+
+    @staticmethod
+    def _depth_usd(levels: List[Tuple[float, float]], depth_n: int = 5) -> float:
+        return sum((px * sz for px, sz in levels[:depth_n]), 0.0)
 
     def fetch_snapshots(self) -> List[MarketSnapshot]:
         # kept for backward compatibility (demo mode fallback)
@@ -78,45 +123,62 @@ class ClobAdapter:
         ]
 
     def fetch_snapshots_from_refs(self, refs: List[GammaMarketRef]) -> List[MarketSnapshot]:
+        return self._run(self.fetch_snapshots_from_refs_async(refs))
+
+    async def fetch_snapshots_from_refs_async(self, refs: List[GammaMarketRef]) -> List[MarketSnapshot]:
+        # Fetch every YES/NO book in bulk batches, sent concurrently on the shared client.
+        # Must run on the adapter's own loop (see _run), which owns the pooled connections.
+        tokens = list(dict.fromkeys(t for ref in refs for t in (ref.yes_token, ref.no_token) if t))
+        n = self.books_batch_size
+        sem = asyncio.Semaphore(self.max_concurrency)
+        books: Dict[str, dict] = {}
+        for part in await asyncio.gather(*[self._fetch_books(sem, tokens[i:i + n]) for i in range(0, len(tokens), n)]):
+            books.update(part)
+
         out: List[MarketSnapshot] = []
         for ref in refs:
-            yes_book = self._fetch_book(ref.yes_token)
-            no_book = self._fetch_book(ref.no_token)
-            if not yes_book or not no_book:
-                continue
-
-            yes_bid = self._best_bid(yes_book.get("bids", []))
-            yes_ask = self._best_ask(yes_book.get("asks", []))
-            no_bid = self._best_bid(no_book.get("bids", []))
-            no_ask = self._best_ask(no_book.get("asks", []))
-
-            if yes_ask <= 0 or no_ask <= 0:
-                continue
-
-            bid_depth = self._depth_usd(yes_book.get("bids", []), 3) + self._depth_usd(no_book.get("bids", []), 3)
-
-            # Filter only truly dead books (near-1 asks + near-0 bids + tiny depth).
-            # Keep thin-but-real books visible so scanner still reports why they are rejected.
-            if yes_ask >= 0.985 and no_ask >= 0.985 and yes_bid <= 0.015 and no_bid <= 0.015 and bid_depth < 25:
-                continue
-
-            depth = self._depth_usd(yes_book.get("bids", []), 5) + self._depth_usd(no_book.get("bids", []), 5)
-
-            out.append(
-                MarketSnapshot(
-                    market_id=ref.market_id,
-                    token_id=ref.yes_token,
-                    question=ref.question,
-                    yes_bid=yes_bid,
-                    yes_ask=yes_ask,
-                    no_bid=no_bid,
-                    no_ask=no_ask,
-                    depth_usd=max(depth, ref.liquidity_num),
-                    accepting_orders=ref.accepting_orders,
-                    yes_hint=ref.yes_price_hint,
-                    no_hint=ref.no_price_hint,
-                    yes_asks=(yes_book.get("asks", []) or [])[:12],
-                    no_asks=(no_book.get("asks", []) or [])[:12],
-                )
-            )
+            snap = self._snapshot_from_books(ref, books.get(ref.yes_token), books.get(ref.no_token))
+            if snap is not None:
+                out.append(snap)
         return out
+
+    def _snapshot_from_books(self, ref: GammaMarketRef, yes_book: Optional[dict], no_book: Optional[dict]) -> Optional[MarketSnapshot]:
+        if not yes_book or not no_book:
+            return None
+
+        yes_bids = self._to_levels(yes_book.get("bids", []))
+        yes_asks = self._to_levels(yes_book.get("asks", []))
+        no_bids = self._to_levels(no_book.get("bids", []))
+        no_asks = self._to_levels(no_book.get("asks", []))
+        yes_bid = self._best_bid(yes_bids)
+        yes_ask = self._best_ask(yes_asks)
+        no_bid = self._best_bid(no_bids)
+        no_ask = self._best_ask(no_asks)
+
+        if yes_ask <= 0 or no_ask <= 0:
+            return None
+
+        bid_depth = self._depth_usd(yes_bids, 3) + self._depth_usd(no_bids, 3)
+
+        # Filter only truly dead books (near-1 asks + near-0 bids + tiny depth).
+        # Keep thin-but-real books visible so scanner still reports why they are rejected.
+        if yes_ask >= 0.985 and no_ask >= 0.985 and yes_bid <= 0.015 and no_bid <= 0.015 and bid_depth < 25:
+            return None
+
+        depth = self._depth_usd(yes_bids, 5) + self._depth_usd(no_bids, 5)
+
+        return MarketSnapshot(
+            market_id=ref.market_id,
+            token_id=ref.yes_token,
+            question=ref.question,
+            yes_bid=yes_bid,
+            yes_ask=yes_ask,
+            no_bid=no_bid,
+            no_ask=no_ask,
+            depth_usd=max(depth, ref.liquidity_num),
+            accepting_orders=ref.accepting_orders,
+            yes_hint=ref.yes_price_hint,
+            no_hint=ref.no_price_hint,
+            yes_asks=yes_asks[:12],
+            no_asks=no_asks[:12],
+        )
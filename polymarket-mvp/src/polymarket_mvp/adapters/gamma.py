@@ -1,10 +1,21 @@
 from __future__ import annotations
+import asyncio
 import json
+import re
+import time
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Collection, Dict, List, Optional
 from datetime import datetime, timezone
 import httpx
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup (pip install .[speed])
+    _json_loads = json.loads
+
 
 @dataclass
 class GammaMarketRef:
@@ -22,156 +33,357 @@ class GammaMarketRef:
     event_start_time: str = ""
 
 
+def _s(v, default: str = "") -> str:
+    # Gamma fields are almost always already str; only coerce when they are not.
+    if isinstance(v, str):
+        return v
+    return default if v is None else str(v)
+
+
+def _f(v, default: float = 0.0) -> float:
+    # Same as float(v or default): falsy -> default, bad values still raise.
+    if type(v) is float:
+        return v
+    return default if not v else float(v)
+
+
+@lru_cache(maxsize=4096)
+def _decode_json_str(raw: str):
+    # clobTokenIds/outcomePrices arrive JSON-encoded and rarely change between
+    # refreshes. Lists come back as tuples so the shared cached value can't be mutated.
+    v = _json_loads(raw)
+    return tuple(v) if isinstance(v, list) else v
+
+
 class GammaAdapter:
-    def __init__(self, base_url: str):
+    """Gamma markets API reader.
+
+    Keeps one pooled httpx.Client for the adapter's lifetime so repeated market
+    lookups reuse keep-alive connections. Per-slug lookups fan out on a pooled
+    AsyncClient (and the private event loop it lives on), at most
+    ``slug_concurrency`` in flight. The ``afetch_*`` variants use that same client
+    and limit, and gather() runs several of them concurrently. Slugs that came back
+    empty are remembered for ``negative_ttl`` seconds and not requested again
+    meanwhile. Call close() or use it as a context manager when done.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int = 32,
+        slug_concurrency: int = 10,
+        negative_ttl: float = 900.0,
+    ):
         self.base_url = base_url.rstrip("/")
         self.call_count = 0
+        self.max_connections = max(1, int(max_connections))
+        self.slug_concurrency = max(1, int(slug_concurrency))
+        self.negative_ttl = float(negative_ttl)
+        self._neg_cache: Dict[str, float] = {}
+        self._client: Optional[httpx.Client] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
 
     def reset_call_count(self):
         self.call_count = 0
 
-    def _counted_get(self, client: httpx.Client, url: str, **kwargs):
+    def __enter__(self) -> "GammaAdapter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._aclient is not None:
+            self._run(self._aclient.aclose())
+            self._aclient = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        self._sem = None
+
+    def _run(self, coro):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        if self._aclient is None:
+            limits = httpx.Limits(
+                max_connections=self.slug_concurrency,
+                max_keepalive_connections=self.slug_concurrency,
+                keepalive_expiry=60.0,
+            )
+            self._aclient = httpx.AsyncClient(timeout=15.0, limits=limits)
+        return self._aclient
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=16,
+                keepalive_expiry=60.0,
+            )
+            self._client = httpx.Client(timeout=15.0, limits=limits)
+        return self._client
+
+    def _counted_get(self, url: str, **kwargs):
         self.call_count += 1
-        return client.get(url, **kwargs)
+        return self._get_client().get(url, **kwargs)
 
     @staticmethod
     def _to_ref(m: dict) -> GammaMarketRef | None:
         try:
             token_ids = m.get("clobTokenIds")
             if isinstance(token_ids, str):
-                token_ids = json.loads(token_ids)
+                token_ids = _decode_json_str(token_ids)
             if not token_ids or len(token_ids) < 2:
                 return None
             prices = m.get("outcomePrices")
             if isinstance(prices, str):
                 try:
-                    prices = json.loads(prices)
+                    prices = _decode_json_str(prices)
                 except Exception:
                     prices = None
-            yes_hint = float(prices[0]) if isinstance(prices, list) and len(prices) > 0 else 0.0
-            no_hint = float(prices[1]) if isinstance(prices, list) and len(prices) > 1 else 0.0
+            yes_hint = float(prices[0]) if isinstance(prices, (list, tuple)) and len(prices) > 0 else 0.0
+            no_hint = float(prices[1]) if isinstance(prices, (list, tuple)) and len(prices) > 1 else 0.0
 
             ev0 = {}
-            try:
-                if isinstance(m.get("events"), list) and m.get("events"):
-                    ev0 = m.get("events")[0] or {}
-            except Exception:
-                ev0 = {}
+            events = m.get("events")
+            if isinstance(events, list) and events:
+                ev0 = events[0] or {}
 
             return GammaMarketRef(
-                market_id=str(m.get("id")),
-                question=str(m.get("question", "")),
-                yes_token=str(token_ids[0]),
-                no_token=str(token_ids[1]),
+                market_id=_s(m.get("id")),
+                question=_s(m.get("question")),
+                yes_token=_s(token_ids[0]),
+                no_token=_s(token_ids[1]),
                 accepting_orders=bool(m.get("acceptingOrders", True)),
-                liquidity_num=float(m.get("liquidityNum") or 0.0),
+                liquidity_num=_f(m.get("liquidityNum")),
                 yes_price_hint=yes_hint,
                 no_price_hint=no_hint,
-                end_date=str(m.get("endDate") or ev0.get("endDate") or ""),
-                slug=str(m.get("slug") or ev0.get("slug") or ""),
-                resolution_source=str(m.get("resolutionSource") or ev0.get("resolutionSource") or ""),
-                event_start_time=str(m.get("eventStartTime") or ev0.get("startTime") or ""),
+                end_date=_s(m.get("endDate") or ev0.get("endDate")),
+                slug=_s(m.get("slug") or ev0.get("slug")),
+                resolution_source=_s(m.get("resolutionSource") or ev0.get("resolutionSource")),
+                event_start_time=_s(m.get("eventStartTime") or ev0.get("startTime")),
             )
         except Exception:
             return None
 
-    def fetch_active_market_refs(self, limit: int = 10, focus_keywords: list[str] | None = None) -> List[GammaMarketRef]:
-        url = f"{self.base_url}/markets"
-        params = {"active": "true", "closed": "false", "limit": str(limit)}
-        with httpx.Client(timeout=15.0) as client:
-            r = self._counted_get(client, url, params=params)
-            r.raise_for_status()
-            arr = r.json()
-
+    @classmethod
+    def _active_refs(cls, arr: list, focus_keywords: list[str] | None) -> List[GammaMarketRef]:
         refs: List[GammaMarketRef] = []
-        kws = [k.lower() for k in (focus_keywords or []) if k]
+        kws = [k for k in (focus_keywords or []) if k]
+        match = re.compile("|".join(re.escape(k) for k in kws), re.IGNORECASE).search if kws else None
         for m in arr:
-            q = str(m.get("question", ""))
-            slug = str(m.get("slug", ""))
-            hay = (q + " " + slug).lower()
-            if kws and not any(k.lower() in hay for k in kws):
+            if match is not None and not match(str(m.get("question", "")) + " " + str(m.get("slug", ""))):
                 continue
-            ref = self._to_ref(m)
+            ref = cls._to_ref(m)
             if ref:
                 refs.append(ref)
         return refs
 
-    def fetch_market_refs_by_slugs(self, slugs: list[str]) -> List[GammaMarketRef]:
-        refs: List[GammaMarketRef] = []
-        with httpx.Client(timeout=15.0) as client:
-            for slug in slugs:
-                if not slug:
-                    continue
-                r = self._counted_get(client, f"{self.base_url}/markets", params={"slug": slug})
-                if r.status_code != 200:
-                    continue
-                arr = r.json()
-                for m in arr:
-                    ref = self._to_ref(m)
-                    if ref:
-                        refs.append(ref)
-        return refs
+    def fetch_active_market_refs(self, limit: int = 10, focus_keywords: list[str] | None = None) -> List[GammaMarketRef]:
+        url = f"{self.base_url}/markets"
+        params = {"active": "true", "closed": "false", "limit": str(limit)}
+        r = self._counted_get(url, params=params)
+        r.raise_for_status()
+        return self._active_refs(r.json(), focus_keywords)
 
-    def fetch_market_refs_by_slug_prefixes(
+    async def afetch_active_market_refs(self, limit: int = 10, focus_keywords: list[str] | None = None) -> List[GammaMarketRef]:
+        params = {"active": "true", "closed": "false", "limit": str(limit)}
+        r = await self._aget_markets(params)
+        r.raise_for_status()
+        return self._active_refs(r.json(), focus_keywords)
+
+    def _get_sem(self) -> asyncio.Semaphore:
+        # Created from inside a coroutine so it binds to the adapter's loop (3.9 binds at init).
+        # Shared by every request on that loop, so concurrent fetch_* calls stay within slug_concurrency.
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.slug_concurrency)
+        return self._sem
+
+    async def _aget_markets(self, params: dict, **kwargs) -> httpx.Response:
+        async with self._get_sem():
+            self.call_count += 1
+            return await self._get_aclient().get(f"{self.base_url}/markets", params=params, **kwargs)
+
+    def gather(self, *coros) -> list:
+        """Run ``afetch_*`` coroutines concurrently on the adapter's loop; results in order.
+
+        The first failure is raised once every call has finished.
+        """
+        async def _all():
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for res in results:
+                if isinstance(res, BaseException):
+                    raise res
+            return results
+
+        return self._run(_all())
+
+    async def _afetch_slug(self, slug: str) -> Optional[list]:
+        # [] means the slug does not exist (404 or empty list); None is any other failure.
+        r = await self._aget_markets({"slug": slug})
+        if r.status_code == 404:
+            return []
+        if r.status_code != 200:
+            return None
+        return r.json()
+
+    async def _afetch_all(self, slugs: list[str]) -> list:
+        # return_exceptions keeps siblings from being left pending on the loop when one fails.
+        results = await asyncio.gather(*[self._afetch_slug(s) for s in slugs], return_exceptions=True)
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+        return results
+
+    def fetch_market_refs_by_slugs(
         self,
-        prefixes: list[str],
-        limit: int = 200,
-        active_only: bool = True,
+        slugs: list[str],
+        cache_misses: Optional[Collection[str]] = None,
     ) -> List[GammaMarketRef]:
-        if not prefixes:
+        """Look up each slug; missing slugs are negatively cached.
+
+        ``cache_misses`` limits which slugs may be negatively cached (default: all),
+        for callers that know some misses may still be listed later.
+        """
+        return self._run(self.afetch_market_refs_by_slugs(slugs, cache_misses))
+
+    async def afetch_market_refs_by_slugs(
+        self,
+        slugs: list[str],
+        cache_misses: Optional[Collection[str]] = None,
+    ) -> List[GammaMarketRef]:
+        now = time.monotonic()
+        neg = self._neg_cache
+        if len(neg) > 4096:
+            for s in [s for s, until in neg.items() if until <= now]:
+                del neg[s]
+        slugs = [s for s in dict.fromkeys(slugs) if s and neg.get(s, 0.0) <= now]
+        if not slugs:
             return []
+        refs: List[GammaMarketRef] = []
+        for slug, arr in zip(slugs, await self._afetch_all(slugs)):
+            if arr is None:
+                continue
+            if not arr:
+                if self.negative_ttl > 0 and (cache_misses is None or slug in cache_misses):
+                    neg[slug] = now + self.negative_ttl
+                continue
+            for m in arr:
+                ref = self._to_ref(m)
+                if ref:
+                    refs.append(ref)
+        return refs
+
+    @staticmethod
+    def _prefix_params(limit: int, active_only: bool) -> dict:
         params = {"limit": str(limit)}
         if active_only:
             params.update({"active": "true", "closed": "false"})
+        return params
 
-        with httpx.Client(timeout=20.0) as client:
-            r = self._counted_get(client, f"{self.base_url}/markets", params=params)
-            r.raise_for_status()
-            arr = r.json()
-
-        prefs = [p.lower() for p in prefixes if p]
+    @classmethod
+    def _prefix_refs(cls, arr: list, prefixes: list[str]) -> List[GammaMarketRef]:
+        prefs = tuple(p.lower() for p in prefixes if p)
         refs: List[GammaMarketRef] = []
+        end_by_id: dict[str, str] = {}
         for m in arr:
             slug = str(m.get("slug", "")).lower()
-            if not any(slug.startswith(p) for p in prefs):
+            if not slug.startswith(prefs):
                 continue
-            ref = self._to_ref(m)
+            ref = cls._to_ref(m)
             if ref:
                 refs.append(ref)
+                end_by_id.setdefault(ref.market_id, str(m.get("endDate")))
 
         # Sort latest-ending first so rolling markets pick newest window.
-        def _end_ts(mref: GammaMarketRef) -> str:
-            return str(next((x.get("endDate") for x in arr if str(x.get("id")) == mref.market_id), ""))
-
-        refs.sort(key=_end_ts, reverse=True)
+        refs.sort(key=lambda r: end_by_id.get(r.market_id, ""), reverse=True)
         return refs
 
-    def fetch_market_refs_by_generated_timeframe_slugs(
+    def fetch_market_refs_by_slug_prefixes(
         self,
         prefixes: list[str],
-        timeframe: str,
-        bucket_seconds: int,
-        windows: int = 8,
-        lookback_windows: int = 8,
+        limit: int = 200,
+        active_only: bool = True,
+    ) -> List[GammaMarketRef]:
+        if not prefixes:
+            return []
+        r = self._counted_get(f"{self.base_url}/markets", params=self._prefix_params(limit, active_only), timeout=20.0)
+        r.raise_for_status()
+        return self._prefix_refs(r.json(), prefixes)
+
+    async def afetch_market_refs_by_slug_prefixes(
+        self,
+        prefixes: list[str],
+        limit: int = 200,
+        active_only: bool = True,
     ) -> List[GammaMarketRef]:
-        # Generate rolling slugs like btc-updown-15m-<unix_ts> / btc-updown-5m-<unix_ts>.
         if not prefixes:
             return []
+        r = await self._aget_markets(self._prefix_params(limit, active_only), timeout=20.0)
+        r.raise_for_status()
+        return self._prefix_refs(r.json(), prefixes)
 
+    @staticmethod
+    def _generated_slugs(
+        prefixes: list[str],
+        timeframe: str,
+        bucket_seconds: int,
+        windows: int,
+        lookback_windows: int,
+    ) -> tuple[list[str], set[str]]:
+        # Generate rolling slugs like btc-updown-15m-<unix_ts> / btc-updown-5m-<unix_ts>.
         now = int(datetime.now(timezone.utc).timestamp())
         base = (now // int(bucket_seconds)) * int(bucket_seconds)
         ts_candidates = [base + int(bucket_seconds) * k for k in range(-int(lookback_windows), int(windows) + 1)]
 
         slugs: list[str] = []
+        past: set[str] = set()
         tf = (timeframe or "").lower()
         for p in prefixes:
             lp = (p or "").lower()
             if tf not in lp:
                 continue
             for t in ts_candidates:
-                slugs.append(f"{p}{t}")
+                slug = f"{p}{t}"
+                slugs.append(slug)
+                if t < base:
+                    past.add(slug)
+        return slugs, past
+
+    def fetch_market_refs_by_generated_timeframe_slugs(
+        self,
+        prefixes: list[str],
+        timeframe: str,
+        bucket_seconds: int,
+        windows: int = 8,
+        lookback_windows: int = 8,
+    ) -> List[GammaMarketRef]:
+        return self._run(self.afetch_market_refs_by_generated_timeframe_slugs(
+            prefixes, timeframe, bucket_seconds, windows, lookback_windows,
+        ))
 
-        return self.fetch_market_refs_by_slugs(slugs)
+    async def afetch_market_refs_by_generated_timeframe_slugs(
+        self,
+        prefixes: list[str],
+        timeframe: str,
+        bucket_seconds: int,
+        windows: int = 8,
+        lookback_windows: int = 8,
+    ) -> List[GammaMarketRef]:
+        if not prefixes:
+            return []
+        slugs, past = self._generated_slugs(prefixes, timeframe, bucket_seconds, windows, lookback_windows)
+        # Only windows that already ended are safe to remember as missing; upcoming
+        # ones may still be listed before they start.
+        return await self.afetch_market_refs_by_slugs(slugs, cache_misses=past)
 
     def fetch_market_refs_by_generated_15m_slugs(self, prefixes: list[str], windows: int = 8) -> List[GammaMarketRef]:
         return self.fetch_market_refs_by_generated_timeframe_slugs(
@@ -1,9 +1,25 @@
+import copy
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns/size are only part of the key: an edited file misses and gets re-parsed.
+    return yaml.load(Path(path).read_text(), Loader=_Loader)
+
 
 def load_config(path: str) -> dict:
     p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(path)
-    return yaml.safe_load(p.read_text())
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(path) from None
+    # Callers get their own copy so nothing can mutate the cached parse.
+    return copy.deepcopy(_load_cached(str(p.resolve()), st.st_mtime_ns, st.st_size))
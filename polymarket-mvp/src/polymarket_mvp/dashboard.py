@@ -1,94 +1,256 @@
+import functools
+import hashlib
 import json
 import mimetypes
+import mmap
+import os
+import socket
+import struct
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+import zlib
+from collections import deque
+from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install .[speed])
+    orjson = None
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional, Linux only; the refresher polls without it
+    INotify = None
+
 ROOT = Path(__file__).resolve().parents[2]
 STATE = ROOT / "data" / "state.json"
 EVENTS = ROOT / "data" / "events.jsonl"
 WEB = ROOT / "web"
+WEB_ROOT = WEB.resolve()
+
+# Parsed events kept in memory; read_events(n) serves n <= TAIL_MAX from there.
+TAIL_MAX = 5000
+
+
+def _loads(raw):
+    if orjson is None:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # append_event writes with stdlib json, which may emit NaN/Infinity.
+        return json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    if orjson is None:
+        return json.dumps(obj).encode()
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
 
 
 def read_state():
     if not STATE.exists():
         return {"cash_usd": None, "positions": [], "realized_pnl_usd": 0}
-    return json.loads(STATE.read_text())
+    return _loads(STATE.read_bytes())
 
 
-def read_events(n=400):
-    if not EVENTS.exists():
-        return []
+def _pread(fd, size, offset):
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
 
-    # Efficient tail-read: avoid loading entire events.jsonl into memory on each request.
-    chunk_size = 64 * 1024
-    data = b""
-    with EVENTS.open("rb") as f:
-        f.seek(0, 2)
-        end = f.tell()
+
+def _tail_bytes(fd, end, needed_lines):
+    """Bytes before offset ``end`` spanning at least ``needed_lines`` newlines.
+
+    Walks newlines backwards over an mmap, so only the pages holding the tail
+    are touched.
+    """
+    if end <= 0:
+        return b""
+    try:
+        mm = mmap.mmap(fd, end, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return _tail_bytes_chunked(fd, end, needed_lines)
+    try:
         pos = end
-        needed_lines = n + 5
-        while pos > 0 and data.count(b"\n") < needed_lines:
-            read_size = min(chunk_size, pos)
-            pos -= read_size
-            f.seek(pos)
-            data = f.read(read_size) + data
-
-    lines = data.decode("utf-8", errors="ignore").splitlines()[-n:]
-    out = []
-    for ln in lines:
+        for _ in range(needed_lines):
+            pos = mm.rfind(b"\n", 0, pos)
+            if pos < 0:
+                break
+        return mm[pos + 1:end]
+    finally:
+        mm.close()
+
+
+def _tail_bytes_chunked(fd, end, needed_lines):
+    # Fallback where mmap is unavailable: chunks are collected back-to-front and
+    # joined once instead of re-prepended.
+    chunk_size = 64 * 1024
+    chunks = []
+    found = 0
+    pos = end
+    while pos > 0 and found < needed_lines:
+        read_size = min(chunk_size, pos)
+        pos -= read_size
+        chunk = _pread(fd, read_size, pos)
+        chunks.append(chunk)
+        found += chunk.count(b"\n")
+    chunks.reverse()
+    return b"".join(chunks)
+
+
+class _EventTail:
+    """Follows an append-only JSONL file, keeping its last ``maxlen`` events parsed.
+
+    After the first read only bytes past the previous EOF are read and parsed. A
+    new inode or a shrunken file (rotation, truncation) rebuilds from the tail.
+    """
+
+    def __init__(self, path: Path, maxlen: int):
+        self.path = path
+        self.maxlen = maxlen
+        self.ino = None
+        self.offset = 0
+        # Bytes after the last newline: a line still being written.
+        self.partial = b""
+        self.events: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def _refresh(self, st) -> None:
+        fd = os.open(self.path, os.O_RDONLY)
         try:
-            out.append(json.loads(ln))
-        except Exception:
-            pass
-    return out
+            if st.st_ino != self.ino or st.st_size < self.offset:
+                self.events.clear()
+                data = _tail_bytes(fd, st.st_size, self.maxlen + 5)
+            else:
+                data = self.partial + _pread(fd, st.st_size - self.offset, self.offset)
+        finally:
+            os.close(fd)
+        self.ino = st.st_ino
+        self.offset = st.st_size
+        # Split the raw bytes directly (no decode, no copy of the complete part);
+        # the piece after the last newline waits in "partial" for its newline.
+        lines = data.split(b"\n")
+        self.partial = lines.pop()
+        for ln in lines:
+            if not ln:
+                continue
+            try:
+                self.events.append(_loads(ln))
+            except ValueError:  # JSONDecodeError / bad utf-8 from a torn write
+                pass
+
+    def read(self, n: int) -> list:
+        # stat under the lock: a size taken before another reader advanced offset
+        # would look like a truncation and force a full rebuild from an older EOF.
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return []
+            if st.st_size != self.offset or st.st_ino != self.ino:
+                self._refresh(st)
+            return list(self.events)[-n:]
+
+
+_EVENT_TAIL = _EventTail(EVENTS, TAIL_MAX)
+
+
+def read_events(n=400):
+    """Last ``n`` (at most TAIL_MAX) events of events.jsonl, parsed."""
+    return _EVENT_TAIL.read(n)
+
+
+_STATS_LOCK = threading.Lock()
+_MISS = object()
+# Parsed values plus their pre-encoded JSON, so unchanged parts of a payload
+# are never re-serialized. The state half is keyed separately from the stats half.
+_STATS_CACHE = {
+    "state_key": _MISS, "state": None, "state_json": b"",
+    "stats_key": _MISS, "stats": None, "stats_json": b"",
+}
+
+
+def _file_key(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def stats_key():
+    # The minute bucket lets the hour/day call windows roll forward while the files sit idle.
+    return (_file_key(STATE), _file_key(EVENTS), int(time.time() // 60))
+
+
+def cached_fragments(key=None):
+    """Encoded (state, api_stats) JSON for ``key``, rebuilt only when the files change.
+
+    Shared by every handler thread; the first one to see a new key does the work
+    while the others wait on the lock instead of repeating it.
+    """
+    if key is None:
+        key = stats_key()
+    state_key, stats_key_ = key[0], key[1:]
+    with _STATS_LOCK:
+        c = _STATS_CACHE
+        if c["state_key"] != state_key:
+            c["state"] = read_state()
+            c["state_json"] = _dumps(c["state"])
+            c["state_key"] = state_key
+        if c["stats_key"] != stats_key_:
+            c["stats"] = api_stats(read_events(TAIL_MAX))
+            c["stats_json"] = _dumps(c["stats"])
+            c["stats_key"] = stats_key_
+        return c["state_json"], c["stats_json"]
+
+
+def payload_json(state_json: bytes, stats_json: bytes) -> bytes:
+    # Spliced by hand so the cached fragments are reused byte-for-byte.
+    server_time = datetime.now(timezone.utc).isoformat().encode()
+    return b'{"state":' + state_json + b',"apiStats":' + stats_json + b',"serverTime":"' + server_time + b'"}'
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_ts_cached(ts: str):
+    # The same tail is re-scanned on every stats refresh, so most lookups are hits.
+    dt = datetime.fromisoformat(ts)
+    return dt, dt.timestamp()
 
 
 def parse_ts(ts: str):
     try:
-        return datetime.fromisoformat(ts)
+        return _parse_ts_cached(ts)[0]
     except Exception:
         return None
 
 
-def api_stats(events):
-    now = datetime.now(timezone.utc)
-    one_hour = now - timedelta(hours=1)
-    one_day = now - timedelta(days=1)
+# datetime.fromtimestamp's range (years 1..9999); values outside it are skipped
+# the same way the old per-event datetime conversion skipped them.
+_EPOCH_MIN = -62135596800.0
+_EPOCH_MAX = 253402300799.0
+
 
-    usage = [e for e in events if e.get("type") == "api_usage"]
-    ws_usage = [e for e in events if e.get("type") == "ws_usage"]
-    total = sum(int(e.get("total_calls", 0)) for e in usage)
+def api_stats(events, now_epoch: float = None):
+    # All window math is on epoch floats; datetimes only appear in the returned ISO strings.
+    if now_epoch is None:
+        now_epoch = time.time()
+    one_hour_ts = now_epoch - 3600
+    one_day_ts = now_epoch - 86400
 
+    total = 0
+    latest_cumulative = None
+    seen_usage = False
     hour_total = 0
     day_total = 0
+    # Epoch floats; converted to datetime once, for the ISO strings in the result.
     latest_data = None
     latest_ws_msg = None
-
-    for e in usage:
-        dt = parse_ts(e.get("ts", ""))
-        if not dt:
-            continue
-        if dt > one_hour:
-            hour_total += int(e.get("total_calls", 0))
-        if dt > one_day:
-            day_total += int(e.get("total_calls", 0))
-        if latest_data is None or dt > latest_data:
-            latest_data = dt
-
-    for e in ws_usage:
-        x = e.get("last_msg_ts")
-        try:
-            if x:
-                dt = datetime.fromtimestamp(float(x), tz=timezone.utc)
-                if latest_ws_msg is None or dt > latest_ws_msg:
-                    latest_ws_msg = dt
-                if latest_data is None or dt > latest_data:
-                    latest_data = dt
-        except Exception:
-            pass
-
     latest_scan = None
     latest_scan_with_data = None
     latest_op_seen = None
@@ -96,80 +258,118 @@ def api_stats(events):
     latest_btc_tick = None
     latest_divergence = None
     latest_ticks = {}
+
+    # One newest-first pass; "latest_*" slots keep the first event of their type seen.
     for e in reversed(events):
-        if e.get("type") in ("opportunity_seen", "ws_opportunity_seen") and latest_op_seen is None:
-            latest_op_seen = e
-        if e.get("type") == "market_groups" and latest_groups is None:
-            latest_groups = e
-        if e.get("type") == "btc_price_tick" and latest_btc_tick is None:
-            latest_btc_tick = e
-        if e.get("type") == "timeframe_divergence" and latest_divergence is None:
-            latest_divergence = e
-        if e.get("type") == "ws_market_tick":
+        t = e.get("type")
+        if t == "ws_market_tick":
             mk = str(e.get("market_id", ""))
             if mk and mk not in latest_ticks:
                 latest_ticks[mk] = e
                 try:
-                    dt = datetime.fromtimestamp(float(e.get("ws_ts", 0)), tz=timezone.utc)
-                    if latest_data is None or dt > latest_data:
-                        latest_data = dt
+                    ts = float(e.get("ws_ts", 0))
                 except Exception:
-                    pass
-            continue
-        if e.get("type") != "market_scan":
-            continue
-        if latest_scan is None:
-            latest_scan = e
-        top = e.get("top_candidates") or []
-        has_asks = bool(top) and (top[0].get("best_ask_yes") is not None) and (top[0].get("best_ask_no") is not None)
-        if has_asks and latest_scan_with_data is None:
-            latest_scan_with_data = e
+                    ts = None
+                if ts is not None and _EPOCH_MIN <= ts <= _EPOCH_MAX and (latest_data is None or ts > latest_data):
+                    latest_data = ts
+        elif t == "api_usage":
+            calls = int(e.get("total_calls", 0))
+            total += calls
+            if not seen_usage:
+                seen_usage = True
+                latest_cumulative = e.get("cumulative_calls")
+            try:
+                ts = _parse_ts_cached(e.get("ts", ""))[1]
+            except Exception:
+                continue
+            if ts > one_hour_ts:
+                hour_total += calls
+            if ts > one_day_ts:
+                day_total += calls
+            if latest_data is None or ts > latest_data:
+                latest_data = ts
+        elif t == "ws_usage":
+            x = e.get("last_msg_ts")
+            try:
+                ts = float(x) if x else None
+            except Exception:
+                ts = None
+            if ts is not None and _EPOCH_MIN <= ts <= _EPOCH_MAX:
+                if latest_ws_msg is None or ts > latest_ws_msg:
+                    latest_ws_msg = ts
+                if latest_data is None or ts > latest_data:
+                    latest_data = ts
+        elif t == "market_scan":
+            if latest_scan is None:
+                latest_scan = e
+            if latest_scan_with_data is None:
+                top = e.get("top_candidates") or []
+                if top and (top[0].get("best_ask_yes") is not None) and (top[0].get("best_ask_no") is not None):
+                    latest_scan_with_data = e
+        elif t in ("opportunity_seen", "ws_opportunity_seen"):
+            if latest_op_seen is None:
+                latest_op_seen = e
+        elif t == "market_groups":
+            if latest_groups is None:
+                latest_groups = e
+        elif t == "btc_price_tick":
+            if latest_btc_tick is None:
+                latest_btc_tick = e
+        elif t == "timeframe_divergence":
+            if latest_divergence is None:
+                latest_divergence = e
 
     if latest_scan_with_data is not None:
         latest_scan = latest_scan_with_data
 
-    def _patch_rows(rows):
+    def _patch_rows(rows, extra=None):
+        # Rows are shared with the tail buffer (and /json), so they are never
+        # mutated. Rows without a newer tick (and no extra fields) pass through
+        # uncopied; the rest get a single shallow copy with every override merged in.
+        extra = extra or {}
         out = []
         for row in rows or []:
-            r = dict(row)
-            t = latest_ticks.get(str(r.get("market_id", "")))
-            if t:
-                y = t.get("best_ask_yes")
-                n = t.get("best_ask_no")
-                if y is not None:
-                    r["best_ask_yes"] = y
-                if n is not None:
-                    r["best_ask_no"] = n
-                if (r.get("best_ask_yes") is not None) and (r.get("best_ask_no") is not None):
-                    s = float(r["best_ask_yes"]) + float(r["best_ask_no"])
-                    r["ask_sum_no_fees"] = s
-                    fee_bump = 0.0035
-                    r["ask_sum_with_fees"] = s + fee_bump
-                    r["signal"] = "OPPORTUNITY" if s < 1.0 else ("WATCH" if s <= 1.01 else "NO_OPPORTUNITY")
-            out.append(r)
+            t = latest_ticks.get(str(row.get("market_id", "")))
+            if not t:
+                out.append({**row, **extra} if extra else row)
+                continue
+            patch = {}
+            y = t.get("best_ask_yes")
+            n = t.get("best_ask_no")
+            if y is not None:
+                patch["best_ask_yes"] = y
+            else:
+                y = row.get("best_ask_yes")
+            if n is not None:
+                patch["best_ask_no"] = n
+            else:
+                n = row.get("best_ask_no")
+            if (y is not None) and (n is not None):
+                s = float(y) + float(n)
+                patch["ask_sum_no_fees"] = s
+                fee_bump = 0.0035
+                patch["ask_sum_with_fees"] = s + fee_bump
+                patch["signal"] = "OPPORTUNITY" if s < 1.0 else ("WATCH" if s <= 1.01 else "NO_OPPORTUNITY")
+            out.append({**row, **extra, **patch} if (extra or patch) else row)
         return out
 
     if latest_scan and (latest_scan.get("top_candidates") or []):
         latest_scan = {**latest_scan, "top_candidates": _patch_rows(latest_scan.get("top_candidates", []))}
 
     if latest_groups:
+        btc_extra = {}
+        if latest_btc_tick:
+            cl = latest_btc_tick.get("chainlink")
+            bn = latest_btc_tick.get("binance")
+            if cl is not None:
+                btc_extra["btc_current"] = round(float(cl), 2)
+            if bn is not None:
+                btc_extra["btc_current_binance"] = round(float(bn), 2)
         latest_groups = {
             **latest_groups,
-            "bitcoin": _patch_rows(latest_groups.get("bitcoin", [])),
+            "bitcoin": _patch_rows(latest_groups.get("bitcoin", []), btc_extra),
             "secondary": _patch_rows(latest_groups.get("secondary", [])),
         }
-        if latest_btc_tick:
-            cl = latest_btc_tick.get("chainlink")
-            bn = latest_btc_tick.get("binance")
-            bpatched = []
-            for r in (latest_groups.get("bitcoin") or []):
-                rr = dict(r)
-                if cl is not None:
-                    rr["btc_current"] = round(float(cl), 2)
-                if bn is not None:
-                    rr["btc_current_binance"] = round(float(bn), 2)
-                bpatched.append(rr)
-            latest_groups["bitcoin"] = bpatched
 
     latest_ticks_by_market = {}
     for mk, t in latest_ticks.items():
@@ -183,9 +383,11 @@ def api_stats(events):
 
     return {
         "apiLink": "https://clob.polymarket.com/book",
-        "latestDataTs": latest_data.isoformat() if latest_data else None,
-        "latestWsTs": latest_ws_msg.isoformat() if latest_ws_msg else None,
-        "totalCalls": total,
+        "latestDataTs": datetime.fromtimestamp(latest_data, tz=timezone.utc).isoformat() if latest_data is not None else None,
+        "latestWsTs": datetime.fromtimestamp(latest_ws_msg, tz=timezone.utc).isoformat() if latest_ws_msg is not None else None,
+        # The newest api_usage carries the loop's running total; older logs lack it,
+        # so fall back to summing the window.
+        "totalCalls": int(latest_cumulative) if latest_cumulative is not None else total,
         "lastHourCalls": hour_total,
         "lastDayCalls": day_total,
         "latestScan": latest_scan,
@@ -197,6 +399,172 @@ def api_stats(events):
     }
 
 
+# Rendering happens on one background refresher thread; request handlers only
+# write out (or splice) bytes it has already built.
+SSE_TICK_SECONDS = 0.5
+
+# Fixed gzip member header (no name, mtime 0). A gzipped /events stream is this
+# header followed by one sync-flushed raw deflate chunk per frame; each chunk comes
+# from a fresh compressor, so it never back-references earlier frames and the
+# same bytes can go to every client.
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _deflate_chunk(data: bytes) -> bytes:
+    c = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(data) + c.flush(zlib.Z_SYNC_FLUSH)
+
+
+def _accepts_gzip(headers) -> bool:
+    return "gzip" in (headers.get("Accept-Encoding") or "")
+
+
+def _sse_frame(state_json: bytes, stats_json: bytes):
+    # (plain, deflated) forms of one frame, each built once for all subscribers.
+    raw = b"data: " + payload_json(state_json, stats_json) + b"\n\n"
+    return raw, _deflate_chunk(raw)
+
+
+def _json_prefix(state_json: bytes, stats_json: bytes, events_json: bytes):
+    # Everything in a /json body except the serverTime value, which goes last so
+    # the cached part is a true prefix: (raw, deflated chunk, crc32 of raw).
+    raw = b'{"state":' + state_json + b',"apiStats":' + stats_json + b',"events":' + events_json + b',"serverTime":"'
+    return raw, _deflate_chunk(raw), zlib.crc32(raw)
+
+
+def json_body(prefix, use_gzip: bool) -> bytes:
+    """A /json body from a cached ``_json_prefix``; only the timestamp is new per request."""
+    raw, deflated, crc = prefix
+    tail = datetime.now(timezone.utc).isoformat().encode() + b'"}'
+    if not use_gzip:
+        return raw + tail
+    c = zlib.compressobj(1, zlib.DEFLATED, -zlib.MAX_WBITS)
+    trailer = struct.pack("<II", zlib.crc32(tail, crc), (len(raw) + len(tail)) & 0xFFFFFFFF)
+    return _GZIP_HEADER + deflated + c.compress(tail) + c.flush() + trailer
+
+
+class _Refresher(threading.Thread):
+    """Rebuilds the SSE frame and /json fragments whenever ``stats_key`` changes.
+
+    Every version is published under ``cond``; SSE clients wait for a version
+    newer than the one they last sent, so a slow client simply skips ahead to
+    the latest frame.
+    """
+
+    def __init__(self, tick: float = SSE_TICK_SECONDS):
+        super().__init__(name="dashboard-refresher", daemon=True)
+        self.tick = tick
+        self.cond = threading.Condition()
+        self.version = 0
+        self.frame = None  # (raw, deflated) SSE frame
+        self.json_prefix = None  # see _json_prefix
+
+    def refresh(self, key=None) -> None:
+        state_json, stats_json = cached_fragments(key)
+        frame = _sse_frame(state_json, stats_json)
+        json_prefix = _json_prefix(state_json, stats_json, _dumps(read_events(60)))
+        with self.cond:
+            self.frame = frame
+            self.json_prefix = json_prefix
+            self.version += 1
+            self.cond.notify_all()
+
+    def run(self) -> None:
+        watcher = _data_watcher()
+        last_key = None
+        while True:
+            key = stats_key()
+            ok = True
+            if key != last_key:
+                started = time.monotonic()
+                try:
+                    self.refresh(key)
+                    last_key = key
+                except Exception:
+                    # e.g. state.json caught mid-write; retry on the next tick.
+                    ok = False
+                if watcher is not None and ok:
+                    # Rebuild at most once per tick even while ticks stream into events.jsonl;
+                    # changes made meanwhile stay queued on the watcher and wake it at once.
+                    time.sleep(max(0.0, self.tick - (time.monotonic() - started)))
+            if watcher is None or not ok:
+                time.sleep(self.tick)
+            else:
+                # Sleep until the data files change (bursts coalesced over 100ms),
+                # or the next minute boundary so the hour/day windows still roll.
+                watcher.read(timeout=int((60 - time.time() % 60) * 1000) + 1, read_delay=100)
+
+    def wait_newer(self, version: int, timeout: float = None):
+        """(version, frame) once a version other than ``version`` is published."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.version != version, timeout)
+            return self.version, self.frame
+
+    def current_json_prefix(self):
+        with self.cond:
+            prefix = self.json_prefix
+        if prefix is None:
+            # Nothing published yet (first request after start): build inline.
+            prefix = _json_prefix(*cached_fragments(), _dumps(read_events(60)))
+        return prefix
+
+
+def _data_watcher():
+    """inotify watch on the directories holding STATE and EVENTS, or None to poll."""
+    if INotify is None:
+        return None
+    mask = (
+        inotify_flags.MODIFY | inotify_flags.CLOSE_WRITE | inotify_flags.CREATE
+        | inotify_flags.MOVED_TO | inotify_flags.DELETE
+    )
+    watcher = None
+    try:
+        watcher = INotify()
+        # Directories rather than files, so a rotated or recreated file is still seen.
+        for d in {STATE.parent, EVENTS.parent}:
+            watcher.add_watch(str(d), mask)
+    except OSError:
+        if watcher is not None:
+            watcher.close()
+        return None
+    return watcher
+
+
+_REFRESHER_LOCK = threading.Lock()
+_REFRESHER = None
+
+
+def get_refresher() -> _Refresher:
+    global _REFRESHER
+    with _REFRESHER_LOCK:
+        if _REFRESHER is None:
+            _REFRESHER = _Refresher()
+            _REFRESHER.start()
+        return _REFRESHER
+
+
+_ASSET_LOCK = threading.Lock()
+_ASSET_CACHE: dict = {}  # path -> (body, content type, etag, mtime_ns)
+
+
+def load_asset(file_path: Path):
+    """(body, content type, etag) for a file under WEB, re-read only when its mtime changes."""
+    try:
+        mtime_ns = file_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    with _ASSET_LOCK:
+        hit = _ASSET_CACHE.get(file_path)
+        if hit is not None and hit[3] == mtime_ns:
+            return hit[:3]
+    body = file_path.read_bytes()
+    ctype = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    with _ASSET_LOCK:
+        _ASSET_CACHE[file_path] = (body, ctype, etag, mtime_ns)
+    return body, ctype, etag
+
+
 class Handler(BaseHTTPRequestHandler):
     def do_GET(self):
         if self.path == "/health":
@@ -206,41 +574,41 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if self.path == "/events":
+            use_gzip = _accepts_gzip(self.headers)
             self.send_response(200)
             self.send_header("Content-Type", "text/event-stream")
             self.send_header("Cache-Control", "no-cache")
             self.send_header("Connection", "keep-alive")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Vary", "Accept-Encoding")
             self.end_headers()
+            # Frames are small and each is a single write; don't let Nagle hold them back.
+            try:
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
 
-            last_blob = None
+            refresher = get_refresher()
+            version = 0
             try:
+                if use_gzip:
+                    self.wfile.write(_GZIP_HEADER)
                 while True:
-                    events = read_events(5000)
-                    state = read_state()
-                    stats = api_stats(events)
-                    blob = json.dumps({"state": state, "apiStats": stats, "serverTime": datetime.now(timezone.utc).isoformat()})
-                    if blob != last_blob:
-                        self.wfile.write(f"data: {blob}\n\n".encode())
-                        self.wfile.flush()
-                        last_blob = blob
-                    time.sleep(0.5)
+                    version, frame = refresher.wait_newer(version)
+                    self.wfile.write(frame[1 if use_gzip else 0])
+                    self.wfile.flush()
             except Exception:
                 return
 
-        events = read_events(5000)
-        state = read_state()
-        stats = api_stats(events)
-
         if self.path == "/json":
-            payload = {
-                "state": state,
-                "apiStats": stats,
-                "serverTime": datetime.now(timezone.utc).isoformat(),
-                "events": events[-60:],
-            }
-            body = json.dumps(payload).encode()
+            use_gzip = _accepts_gzip(self.headers)
+            body = json_body(get_refresher().current_json_prefix(), use_gzip)
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Vary", "Accept-Encoding")
             self.send_header("Content-Length", str(len(body)))
             self.end_headers()
             self.wfile.write(body)
@@ -252,12 +620,21 @@ class Handler(BaseHTTPRequestHandler):
 
         safe_path = request_path.lstrip("/")
         file_path = (WEB / safe_path).resolve()
-        if file_path.is_file() and WEB.resolve() in file_path.parents:
-            body = file_path.read_bytes()
-            ctype = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
+        asset = load_asset(file_path) if file_path.is_file() and WEB_ROOT in file_path.parents else None
+        if asset is not None:
+            body, ctype, etag = asset
+            inm = self.headers.get("If-None-Match")
+            if inm and (inm.strip() == "*" or etag in [t.strip() for t in inm.split(",")]):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "max-age=60, must-revalidate")
+                self.end_headers()
+                return
             self.send_response(200)
             self.send_header("Content-Type", ctype)
             self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "max-age=60, must-revalidate")
             self.end_headers()
             self.wfile.write(body)
             return
@@ -267,4 +644,5 @@ class Handler(BaseHTTPRequestHandler):
 
 
 if __name__ == "__main__":
+    get_refresher()
     ThreadingHTTPServer(("0.0.0.0", 8787), Handler).serve_forever()
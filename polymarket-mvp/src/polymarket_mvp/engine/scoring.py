@@ -1,22 +1,14 @@
-from typing import List, Tuple
+from operator import attrgetter
+from typing import List, Optional, Tuple
 from polymarket_mvp.models import MarketSnapshot, Opportunity
 
 
-def _as_float(x, default: float = 0.0) -> float:
-    try:
-        return float(x)
-    except Exception:
-        return default
-
-
-def _bookwalk_buy_price(asks: List[dict], target_size_usd: float, fallback_price: float) -> float:
+def _bookwalk_buy_price(asks: List[Tuple[float, float]], target_size_usd: float, fallback_price: float) -> float:
     remaining = max(0.0, target_size_usd)
     total_cost = 0.0
     total_qty = 0.0
 
-    for lvl in asks:
-        px = _as_float((lvl or {}).get("price"), 0.0)
-        qty = _as_float((lvl or {}).get("size"), 0.0)
+    for px, qty in asks:
         if px <= 0 or qty <= 0:
             continue
 
@@ -56,58 +48,85 @@ def effective_buy_prices(s: MarketSnapshot) -> Tuple[float, float]:
 
 
 def depth_aware_buy_prices(s: MarketSnapshot, target_size_usd: float) -> Tuple[float, float]:
-    yes_top, no_top = effective_buy_prices(s)
-
-    yes_book = _bookwalk_buy_price(getattr(s, "yes_asks", []) or [], target_size_usd=target_size_usd, fallback_price=yes_top)
-    no_book = _bookwalk_buy_price(getattr(s, "no_asks", []) or [], target_size_usd=target_size_usd, fallback_price=no_top)
-
-    # Keep parity alternative as a floor if direct ask book is worse.
+    # Same result as walking from effective_buy_prices, with the parity prices computed once.
     yes_via_parity = 1.0 - s.no_bid if s.no_bid > 0 else 1.0
     no_via_parity = 1.0 - s.yes_bid if s.yes_bid > 0 else 1.0
+    yes_direct = s.yes_ask if s.yes_ask > 0 else 1.0
+    no_direct = s.no_ask if s.no_ask > 0 else 1.0
+    yes_top = max(0.0, min(1.0, min(yes_direct, yes_via_parity)))
+    no_top = max(0.0, min(1.0, min(no_direct, no_via_parity)))
+
+    yes_book = _bookwalk_buy_price(s.yes_asks, target_size_usd=target_size_usd, fallback_price=yes_top)
+    no_book = _bookwalk_buy_price(s.no_asks, target_size_usd=target_size_usd, fallback_price=no_top)
 
+    # Keep parity alternative as a floor if direct ask book is worse.
     yes_exec = max(0.0, min(1.0, min(yes_book, yes_via_parity)))
     no_exec = max(0.0, min(1.0, min(no_book, no_via_parity)))
     return yes_exec, no_exec
 
 
-def rank_candidates(snapshots: List[MarketSnapshot], cfg: dict) -> List[Opportunity]:
-    out: List[Opportunity] = []
+def rank_candidates(
+    snapshots: List[MarketSnapshot],
+    cfg: dict,
+    min_edge_bps: Optional[float] = None,
+) -> List[Opportunity]:
     fee_bps = float(cfg["scoring"]["fee_bps"])
     slippage_bps = float(cfg["scoring"]["slippage_bps"])
     target_size_usd = float(cfg["scoring"].get("target_size_usd", 20.0))
+    # With a cutoff, sides below it are dropped before an Opportunity is built or sorted.
+    filtered = min_edge_bps is not None
+    min_edge = float(min_edge_bps) if filtered else 0.0
 
-    for s in snapshots:
-        if not s.accepting_orders:
-            continue
-
-        yes_buy, no_buy = depth_aware_buy_prices(s, target_size_usd=target_size_usd)
+    # Price every tradable market first, then derive edges and sizes in one flat pass.
+    priced = [
+        (s.market_id, s.depth_usd, *depth_aware_buy_prices(s, target_size_usd=target_size_usd))
+        for s in snapshots
+        if s.accepting_orders
+    ]
 
-        edge_yes_bps = (0.5 - yes_buy) * 10000 - fee_bps - slippage_bps
-        edge_no_bps = (0.5 - no_buy) * 10000 - fee_bps - slippage_bps
-
-        base_size = min(50.0, max(10.0, s.depth_usd * 0.005))
-        out.append(
-            Opportunity(
-                market_id=s.market_id,
-                side="BUY_YES",
-                edge_bps=round(edge_yes_bps, 2),
-                expected_price=yes_buy,
-                size_usd=base_size,
+    out: List[Opportunity] = []
+    append = out.append
+    for market_id, depth_usd, yes_buy, no_buy in priced:
+        edge_yes_bps = round((0.5 - yes_buy) * 10000 - fee_bps - slippage_bps, 2)
+        edge_no_bps = round((0.5 - no_buy) * 10000 - fee_bps - slippage_bps, 2)
+        keep_yes = not filtered or edge_yes_bps >= min_edge
+        keep_no = not filtered or edge_no_bps >= min_edge
+        if not (keep_yes or keep_no):
+            continue
+        scaled = depth_usd * 0.005
+        base_size = 50.0 if scaled >= 50.0 else (scaled if scaled > 10.0 else 10.0)
+        if keep_yes:
+            append(
+                Opportunity(
+                    market_id=market_id,
+                    side="BUY_YES",
+                    edge_bps=edge_yes_bps,
+                    expected_price=yes_buy,
+                    size_usd=base_size,
+                )
             )
-        )
-        out.append(
-            Opportunity(
-                market_id=s.market_id,
-                side="BUY_NO",
-                edge_bps=round(edge_no_bps, 2),
-                expected_price=no_buy,
-                size_usd=base_size,
+        if keep_no:
+            append(
+                Opportunity(
+                    market_id=market_id,
+                    side="BUY_NO",
+                    edge_bps=edge_no_bps,
+                    expected_price=no_buy,
+                    size_usd=base_size,
+                )
             )
-        )
 
-    return sorted(out, key=lambda x: x.edge_bps, reverse=True)
+    return sorted(out, key=attrgetter("edge_bps"), reverse=True)
 
 
-def score_opportunities(snapshots: List[MarketSnapshot], cfg: dict) -> List[Opportunity]:
+def score_opportunities(
+    snapshots: List[MarketSnapshot],
+    cfg: dict,
+    ranked: Optional[List[Opportunity]] = None,
+) -> List[Opportunity]:
+    # Pass ``ranked`` when rank_candidates was already run on these snapshots, so
+    # the book walks are not repeated.
     min_edge = float(cfg["scoring"]["min_edge_bps"])
-    return [c for c in rank_candidates(snapshots, cfg) if c.edge_bps >= min_edge]
+    if ranked is None:
+        return rank_candidates(snapshots, cfg, min_edge_bps=min_edge)
+    return [c for c in ranked if c.edge_bps >= min_edge]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; on 3.9 results simply keep a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class LiveOrderResult:
     ok: bool
     order_id: Optional[str] = None
@@ -13,6 +20,19 @@ class LiveOrderResult:
     raw: Optional[dict] = None
 
 
+# API errors can embed whole response bodies; keep logged error strings bounded.
+ERROR_MAX_CHARS = 500
+
+
+def _error(prefix: str, e: BaseException | str) -> str:
+    msg = f"{prefix}: {e}"
+    return msg if len(msg) <= ERROR_MAX_CHARS else msg[: ERROR_MAX_CHARS - 3] + "..."
+
+
+# Shared by every dry-run place() that doesn't ask for the echoed order; treat as read-only.
+_DRY_RUN_RESULT = LiveOrderResult(ok=True, order_id="dry_run")
+
+
 class LiveExecutor:
     """Live Polymarket CLOB executor.
 
@@ -30,9 +50,27 @@ class LiveExecutor:
         self.signature_type = int(live.get("signature_type", 1))
         self.default_order_type = str(live.get("order_type", "GTC")).upper()
 
+        # Credentials are read from the environment once; they don't change mid-process.
+        env = os.environ
+        self._env_key = env.get("POLYMARKET_PRIVATE_KEY", "").strip()
+        self._env_funder = env.get("POLYMARKET_FUNDER", "").strip()
+        self._env_api_key = env.get("POLYMARKET_API_KEY", "").strip()
+        self._env_api_secret = env.get("POLYMARKET_API_SECRET", "").strip()
+        self._env_api_passphrase = env.get("POLYMARKET_API_PASSPHRASE", "").strip()
+
         self._client = None
         self._imports_ok = False
         self._import_error = None
+        # Bound once by _ensure_client so place() skips the import and getattr lookups.
+        self._OrderArgs = None
+        self._PostOrdersArgs = None
+        self._ot_default = None
+        self._ot_post_only = None
+        # Failed connects back off exponentially (1s doubling to 60s) instead of
+        # re-deriving API creds over HTTP on every place() during an outage.
+        self._next_retry_ts = 0.0
+        self._backoff = 1.0
+        self._last_client_error: Optional[str] = None
 
     def _ensure_client(self) -> Tuple[bool, Optional[str]]:
         if self._client is not None:
@@ -40,17 +78,31 @@ class LiveExecutor:
         if self.dry_run:
             return True, None
 
+        now = time.monotonic()
+        if now < self._next_retry_ts:
+            return False, f"backoff_active: {self._last_client_error}"
+        ok, err = self._connect()
+        if ok:
+            self._backoff = 1.0
+        else:
+            self._last_client_error = err
+            self._next_retry_ts = now + self._backoff
+            self._backoff = min(self._backoff * 2, 60.0)
+        return ok, err
+
+    def _connect(self) -> Tuple[bool, Optional[str]]:
         try:
             from py_clob_client.client import ClobClient
+            from py_clob_client.clob_types import OrderArgs, OrderType
         except Exception as e:
-            self._import_error = f"py_clob_client_missing: {e}"
+            self._import_error = _error("py_clob_client_missing", e)
             return False, self._import_error
 
-        key = os.getenv("POLYMARKET_PRIVATE_KEY", "").strip()
-        funder = os.getenv("POLYMARKET_FUNDER", "").strip()
-        api_key = os.getenv("POLYMARKET_API_KEY", "").strip()
-        api_secret = os.getenv("POLYMARKET_API_SECRET", "").strip()
-        api_passphrase = os.getenv("POLYMARKET_API_PASSPHRASE", "").strip()
+        key = self._env_key
+        funder = self._env_funder
+        api_key = self._env_api_key
+        api_secret = self._env_api_secret
+        api_passphrase = self._env_api_passphrase
         if not key:
             return False, "POLYMARKET_PRIVATE_KEY is missing"
 
@@ -72,13 +124,24 @@ class LiveExecutor:
             else:
                 creds = c.create_or_derive_api_creds()
                 c.set_api_creds(creds)
+            self._OrderArgs = OrderArgs
+            try:
+                from py_clob_client.clob_types import PostOrdersArgs
+            except ImportError:  # older py-clob-client without the batch endpoint
+                PostOrdersArgs = None
+            self._PostOrdersArgs = PostOrdersArgs
+            self._ot_default = getattr(OrderType, self.default_order_type, OrderType.GTC)
+            self._ot_post_only = getattr(OrderType, "POST_ONLY", OrderType.GTC)
             self._client = c
             self._imports_ok = True
             return True, None
         except Exception as e:
-            return False, f"clob_init_failed: {e}"
+            return False, _error("clob_init_failed", e)
 
-    def place(self, token_id: str, side: str, price: float, size: float, post_only: bool = False) -> LiveOrderResult:
+    def _precheck(
+        self, token_id: str, side: str, price: float, size: float, post_only: bool = False, return_raw: bool = False,
+    ) -> Optional[LiveOrderResult]:
+        # The result for orders that never reach the CLOB; None means sign and post it.
         if not self.enabled:
             return LiveOrderResult(ok=False, error="live_disabled")
 
@@ -88,6 +151,8 @@ class LiveExecutor:
             return LiveOrderResult(ok=False, error="invalid_price_or_size")
 
         if self.dry_run:
+            if not return_raw:
+                return _DRY_RUN_RESULT
             return LiveOrderResult(ok=True, order_id="dry_run", raw={
                 "token_id": token_id,
                 "side": side,
@@ -95,30 +160,115 @@ class LiveExecutor:
                 "size": size,
                 "post_only": post_only,
             })
+        return None
+
+    def _sign(self, token_id: str, side: str, price: float, size: float, post_only: bool = False):
+        args = self._OrderArgs(
+            token_id=token_id,
+            price=float(price),
+            size=float(size),
+            side=side.upper(),
+        )
+        return self._client.create_order(args), (self._ot_post_only if post_only else self._ot_default)
+
+    @staticmethod
+    def _result(resp) -> LiveOrderResult:
+        oid = None
+        if isinstance(resp, dict):
+            oid = resp.get("orderID") or resp.get("id")
+        return LiveOrderResult(ok=True, order_id=oid, raw=resp if isinstance(resp, dict) else {"resp": str(resp)})
+
+    @classmethod
+    def _batch_entry_result(cls, entry) -> LiveOrderResult:
+        # post_orders answers per order with success/errorMsg instead of raising.
+        if not isinstance(entry, dict):
+            return LiveOrderResult(ok=False, error=_error("post_orders_unexpected_response", repr(entry)), raw={"resp": str(entry)})
+        if entry.get("success") is False or entry.get("errorMsg"):
+            return LiveOrderResult(
+                ok=False,
+                order_id=entry.get("orderID") or entry.get("id") or None,
+                error=_error("post_order_rejected", entry.get("errorMsg") or "success=false"),
+                raw=entry,
+            )
+        return cls._result(entry)
+
+    def place(
+        self, token_id: str, side: str, price: float, size: float, post_only: bool = False, return_raw: bool = False,
+    ) -> LiveOrderResult:
+        # return_raw only matters in dry-run: it echoes the would-be order back in ``raw``.
+        early = self._precheck(token_id, side, price, size, post_only, return_raw)
+        if early is not None:
+            return early
 
         ok, err = self._ensure_client()
         if not ok:
             return LiveOrderResult(ok=False, error=err)
 
         try:
-            from py_clob_client.clob_types import OrderArgs, OrderType
+            signed, order_type = self._sign(token_id, side, price, size, post_only)
+            resp = self._client.post_order(signed, order_type)
+            return self._result(resp)
+        except Exception as e:
+            return LiveOrderResult(ok=False, error=_error("post_order_failed", e))
 
-            s = side.upper()
-            order_type_name = "POST_ONLY" if post_only else self.default_order_type
-            order_type = getattr(OrderType, order_type_name, getattr(OrderType, "GTC"))
+    def place_batch(self, orders: List[dict], max_workers: int = 8, return_raw: bool = False) -> List[LiveOrderResult]:
+        """Place several orders (dicts of token_id/side/price/size[/post_only]); results follow input order.
 
-            args = OrderArgs(
-                token_id=token_id,
-                price=float(price),
-                size=float(size),
-                side=s,
-            )
-            signed = self._client.create_order(args)
-            resp = self._client.post_order(signed, order_type)
+        Orders are signed in a thread pool and, when py-clob-client has the batch
+        endpoint, posted in a single request; otherwise the posts run in the pool too.
+        """
+        results: List[Optional[LiveOrderResult]] = [self._precheck(**o, return_raw=return_raw) for o in orders]
+        pending = [i for i, r in enumerate(results) if r is None]
+        if not pending:
+            return results
 
-            oid = None
-            if isinstance(resp, dict):
-                oid = resp.get("orderID") or resp.get("id")
-            return LiveOrderResult(ok=True, order_id=oid, raw=resp if isinstance(resp, dict) else {"resp": str(resp)})
-        except Exception as e:
-            return LiveOrderResult(ok=False, error=f"post_order_failed: {e}")
+        ok, err = self._ensure_client()
+        if not ok:
+            for i in pending:
+                results[i] = LiveOrderResult(ok=False, error=err)
+            return results
+
+        def sign(i):
+            try:
+                return i, self._sign(**orders[i]), None
+            except Exception as e:
+                return i, None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+            signed = []
+            for i, so, e in pool.map(sign, pending):
+                if e is not None:
+                    results[i] = LiveOrderResult(ok=False, error=_error("post_order_failed", e))
+                else:
+                    signed.append((i, so))
+
+            if signed and self._PostOrdersArgs is not None and hasattr(self._client, "post_orders"):
+                try:
+                    resp = self._client.post_orders([
+                        self._PostOrdersArgs(order=order, orderType=order_type) for _, (order, order_type) in signed
+                    ])
+                except Exception as e:
+                    for i, _ in signed:
+                        results[i] = LiveOrderResult(ok=False, error=_error("post_order_failed", e))
+                    return results
+                if isinstance(resp, list) and len(resp) == len(signed):
+                    for (i, _), r in zip(signed, resp):
+                        results[i] = self._batch_entry_result(r)
+                else:
+                    # Can't tell which orders (if any) were accepted; report none as placed.
+                    err = _error("post_orders_unexpected_response", repr(resp))
+                    raw = resp if isinstance(resp, dict) else {"resp": str(resp)}
+                    for i, _ in signed:
+                        results[i] = LiveOrderResult(ok=False, error=err, raw=raw)
+                return results
+
+            def post(item):
+                i, (order, order_type) = item
+                try:
+                    return i, self._result(self._client.post_order(order, order_type))
+                except Exception as e:
+                    return i, LiveOrderResult(ok=False, error=_error("post_order_failed", e))
+
+            for i, r in pool.map(post, signed):
+                results[i] = r
+        return results
@@ -1,47 +1,88 @@
+import threading
 import time
+from dataclasses import dataclass
 from polymarket_mvp.config import load_config
 from polymarket_mvp.main import run_once, _ensure_ws_hook
 from polymarket_mvp.sim.paper import init_state
-from polymarket_mvp.utils.storage import save_state
+from polymarket_mvp.utils.storage import get_event_sink, save_state
+
+
+@dataclass(frozen=True)
+class LoopCfg:
+    """run_forever's own settings, coerced once at startup."""
+
+    interval: float
+    event_driven: bool
+    use_ws: bool
+    min_cycle_seconds: float
+    events_path: str
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "LoopCfg":
+        app = cfg.get("app", {})
+        return cls(
+            interval=float(app.get("loop_seconds", 15)),
+            event_driven=bool(app.get("event_driven", True)),
+            use_ws=bool(cfg.get("data", {}).get("use_clob_ws", True)),
+            min_cycle_seconds=float(app.get("min_cycle_seconds", 0.2)),
+            events_path=str(cfg["storage"]["events_path"]),
+        )
+
+
+def _preload_clob_client() -> None:
+    # Pays py-clob-client's import (web3/eth signing stack) off the main thread;
+    # if it is missing, LiveExecutor._ensure_client still reports that on first use.
+    try:
+        import py_clob_client.client  # noqa: F401
+    except Exception:
+        pass
 
 
 def run_forever(config_path: str):
     cfg = load_config(config_path)
+    mode = str(cfg.get("app", {}).get("mode", "paper")).lower()
     # Reset ledger on restart only in paper mode.
-    if str(cfg.get("app", {}).get("mode", "paper")).lower() == "paper":
+    if mode == "paper":
         save_state(cfg["storage"]["state_path"], init_state(cfg))
-    interval = float(cfg.get("app", {}).get("loop_seconds", 15))
-    event_driven = bool(cfg.get("app", {}).get("event_driven", True))
-    use_ws = bool(cfg.get("data", {}).get("use_clob_ws", True))
-    min_cycle_seconds = float(cfg.get("app", {}).get("min_cycle_seconds", 0.2))
+    live = cfg.get("live", {})
+    if mode == "live" and live.get("enabled", False) and not live.get("dry_run", True):
+        threading.Thread(target=_preload_clob_client, name="clob-preload", daemon=True).start()
+    lcfg = LoopCfg.from_config(cfg)
+    # The hook is a process singleton; resolve it once rather than twice per cycle.
+    ws_hook = _ensure_ws_hook() if lcfg.use_ws else None
     last_ws_ts = 0.0
 
     while True:
-        cycle_start = time.time()
+        cycle_start = time.monotonic()
+        if ws_hook is not None:
+            # Taken before the cycle, so a message that lands while run_once works
+            # wakes the next wait immediately instead of counting as already seen.
+            try:
+                v = ws_hook.last_update()
+                if v > last_ws_ts:
+                    last_ws_ts = v
+            except Exception:
+                pass
         try:
             run_once(cfg)
-            if use_ws:
-                try:
-                    st = _ensure_ws_hook().stats()
-                    last_ws_ts = max(last_ws_ts, float(st.get("last_msg_ts") or 0.0))
-                except Exception:
-                    pass
         except Exception as e:
-            from polymarket_mvp.utils.storage import append_event
-            append_event(cfg["storage"]["events_path"], {"type": "loop_error", "error": str(e)})
-
-        elapsed = time.time() - cycle_start
-        if elapsed < min_cycle_seconds:
-            time.sleep(min_cycle_seconds - elapsed)
+            get_event_sink(lcfg.events_path).put({"type": "loop_error", "error": str(e)})
 
-        if event_driven and use_ws:
+        if lcfg.event_driven and ws_hook is not None:
+            # min_cycle_seconds is the floor between cycles; the WS wait covers the rest.
+            elapsed = time.monotonic() - cycle_start
+            if elapsed < lcfg.min_cycle_seconds:
+                time.sleep(lcfg.min_cycle_seconds - elapsed)
             try:
-                last_ws_ts = _ensure_ws_hook().wait_for_update(last_ws_ts, timeout=interval)
+                last_ws_ts = ws_hook.wait_for_update(last_ws_ts, timeout=lcfg.interval)
                 continue
             except Exception:
                 pass
 
-        time.sleep(interval)
+        # Fixed cadence, or a failed WS wait: a single sleep up to the next cycle start.
+        left = max(lcfg.min_cycle_seconds, lcfg.interval) - (time.monotonic() - cycle_start)
+        if left > 0:
+            time.sleep(left)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,12 @@ import argparse
 import re
 import math
 import random
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import Optional
 
 import httpx
@@ -13,7 +18,7 @@ from polymarket_mvp.adapters.clob import ClobAdapter
 from polymarket_mvp.engine.scoring import score_opportunities, rank_candidates, depth_aware_buy_prices
 from polymarket_mvp.risk.guards import approve
 from polymarket_mvp.sim.paper import open_position, close_position, close_fraction
-from polymarket_mvp.utils.storage import load_state, save_state, append_event
+from polymarket_mvp.utils.storage import load_state, save_state, append_event, get_event_sink
 from polymarket_mvp.adapters.gamma import GammaAdapter
 from polymarket_mvp.ops_intel import build_market_radar, build_inefficiency_report, build_flow_watch
 from polymarket_mvp.ws_hook import ClobWsHook
@@ -21,24 +26,68 @@ from polymarket_mvp.rtds_hook import BtcRtdsHook
 from polymarket_mvp.execution.live import LiveExecutor
 
 
+class BtcHistory:
+    """Time-ordered BTC signal samples held as parallel lists.
+
+    Expired samples are dropped by advancing ``start``; the lists are compacted
+    once the dead prefix outgrows the live part, so eviction is O(1) amortized.
+    Readers index ``ts``/``p``/``cl``/``bi`` from ``start`` to the end.
+    """
+
+    __slots__ = ("ts", "p", "cl", "bi", "start")
+
+    def __init__(self):
+        self.ts = []
+        self.p = []
+        self.cl = []
+        self.bi = []
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.ts) - self.start
+
+    def append(self, t: float, p: float, cl, bi):
+        self.ts.append(t)
+        self.p.append(p)
+        self.cl.append(cl)
+        self.bi.append(bi)
+
+    def evict_before(self, t: float):
+        ts = self.ts
+        i = self.start
+        n = len(ts)
+        while i < n and ts[i] < t:
+            i += 1
+        if i > 64 and 2 * i > n:
+            del ts[:i], self.p[:i], self.cl[:i], self.bi[:i]
+            i = 0
+        self.start = i
+
+
 _WS_HOOK = None
+_CLOB = None
+_GAMMA = None
+_API_CALLS_TOTAL = 0
 _RTDS_BTC = None
 _ALT_REFS_CACHE = []
 _ALT_REFS_TS = 0.0
 _BTC_TARGET_CACHE = {}
 _BTC_TARGET_MISS_LAST = {}
 _BTC_PRICE_CACHE = {}
+_BTC_PRICE_HTTP = None
 _BTC_CURRENT_CACHE = {"ts": 0.0, "price": None}
 _BTC_PRICE_CACHE_TTL_OK = 120.0
 _BTC_PRICE_CACHE_TTL_MISS = 20.0
 _BTC_PRICE_FORCE_REFRESH_SECONDS = 60.0
-_BTC_SIGNAL_HISTORY = []
+_BTC_SIGNAL_HISTORY = BtcHistory()
 _MODEL_STATS = {
     "TA": {"trades": 0, "wins": 0, "pnl": 0.0},
     "LL": {"trades": 0, "wins": 0, "pnl": 0.0},
     "RG": {"trades": 0, "wins": 0, "pnl": 0.0},
     "BK": {"trades": 0, "wins": 0, "pnl": 0.0},
 }
+# _model_weight results by model name; cleared whenever _MODEL_STATS changes.
+_MODEL_WEIGHT_CACHE = {}
 _LAST_CLOSE_TS = {}
 _LAST_CLOSE_REASON = {}
 _LAST_CLOSE_SIDE = {}
@@ -150,6 +199,25 @@ def _ensure_live_executor(cfg: dict) -> LiveExecutor:
     return _LIVE_EXECUTOR
 
 
+def _ensure_clob(base_url: str) -> ClobAdapter:
+    # Kept across cycles so its pooled HTTP connections stay warm.
+    global _CLOB
+    if _CLOB is None or _CLOB.base_url != base_url.rstrip("/"):
+        if _CLOB is not None:
+            _CLOB.close()
+        _CLOB = ClobAdapter(base_url)
+    return _CLOB
+
+
+def _ensure_gamma(base_url: str) -> GammaAdapter:
+    global _GAMMA
+    if _GAMMA is None or _GAMMA.base_url != base_url.rstrip("/"):
+        if _GAMMA is not None:
+            _GAMMA.close()
+        _GAMMA = GammaAdapter(base_url)
+    return _GAMMA
+
+
 def _ensure_ws_hook() -> ClobWsHook:
     global _WS_HOOK
     if _WS_HOOK is None:
@@ -186,7 +254,8 @@ def _ensure_btc_live_feed(events_path: str = None):
     if _RTDS_BTC is None:
         _RTDS_BTC = BtcRtdsHook()
         if events_path:
-            _RTDS_BTC.set_on_tick(lambda t: append_event(events_path, {"type": "btc_price_tick", **t}))
+            sink = get_event_sink(events_path)
+            _RTDS_BTC.set_on_tick(lambda t: sink.put({"type": "btc_price_tick", **t}))
         _RTDS_BTC.start()
 
 
@@ -218,35 +287,42 @@ def _update_btc_signal_history(chainlink_px: Optional[float], binance_px: Option
     elif binance_px is not None:
         p = float(binance_px)
     if p is not None and p > 0:
-        _BTC_SIGNAL_HISTORY.append({"t": now, "p": p, "cl": chainlink_px, "bi": binance_px})
-    keep_after = now - 700
-    while _BTC_SIGNAL_HISTORY and _BTC_SIGNAL_HISTORY[0]["t"] < keep_after:
-        _BTC_SIGNAL_HISTORY.pop(0)
+        _BTC_SIGNAL_HISTORY.append(now, p, chainlink_px, binance_px)
+    _BTC_SIGNAL_HISTORY.evict_before(now - 700)
 
 
 def _price_ago(sec: float) -> Optional[float]:
-    if not _BTC_SIGNAL_HISTORY:
+    h = _BTC_SIGNAL_HISTORY
+    if not h:
         return None
-    now = _BTC_SIGNAL_HISTORY[-1]["t"]
-    for x in reversed(_BTC_SIGNAL_HISTORY):
-        if (now - x["t"]) >= sec:
-            return float(x["p"])
-    return float(_BTC_SIGNAL_HISTORY[0]["p"])
+    ts = h.ts
+    n = len(ts)
+    now = ts[-1]
+    # Newest sample at least ``sec`` old. bisect lands within a step of it; the
+    # nudges re-check with the original comparison so float rounding can't shift it.
+    i = bisect_right(ts, now - sec, h.start, n) - 1
+    while i + 1 < n and (now - ts[i + 1]) >= sec:
+        i += 1
+    while i >= h.start and (now - ts[i]) < sec:
+        i -= 1
+    return h.p[i] if i >= h.start else h.p[h.start]
 
 
 def _price_near_ts(ts: float, max_delta_s: float = 120.0) -> Optional[float]:
-    if not _BTC_SIGNAL_HISTORY:
+    h = _BTC_SIGNAL_HISTORY
+    if not h:
         return None
-    best = None
-    best_dt = 1e18
-    for x in _BTC_SIGNAL_HISTORY:
-        dt = abs(float(x.get("t", 0.0)) - float(ts))
-        if dt < best_dt:
-            best_dt = dt
-            best = float(x.get("p"))
-    if best is None or best_dt > max_delta_s:
+    ts = float(ts)
+    hts = h.ts
+    # Closest sample is one of the two around the insertion point; ties go to the earlier one.
+    j = bisect_left(hts, ts, h.start, len(hts))
+    if j == len(hts) or (j > h.start and abs(hts[j - 1] - ts) <= abs(hts[j] - ts)):
+        j -= 1
+    while j > h.start and hts[j - 1] == hts[j]:
+        j -= 1
+    if abs(hts[j] - ts) > max_delta_s:
         return None
-    return best
+    return h.p[j]
 
 
 def _fetch_alt_price(source: str) -> Optional[float]:
@@ -320,40 +396,66 @@ def _impulse_signal(source: str) -> dict:
 
 
 def _compute_btc_signal() -> dict:
-    if len(_BTC_SIGNAL_HISTORY) < 5:
+    h = _BTC_SIGNAL_HISTORY
+    if len(h) < 5:
         return {"p_up": 0.5, "lead_bps": 0.0, "rf": 0.0, "rs": 0.0, "sigma": 0.0001, "rsi_n": 0.0}
-    now = _BTC_SIGNAL_HISTORY[-1]["t"]
-    p_now = float(_BTC_SIGNAL_HISTORY[-1]["p"])
+    ts = h.ts
+    px = h.p
+    n = len(ts)
+    now = ts[-1]
+    p_now = px[-1]
     p20 = _price_ago(20) or p_now
     p120 = _price_ago(120) or p_now
     rf = 0.0 if p20 <= 0 else math.log(p_now / p20)
     rs = 0.0 if p120 <= 0 else math.log(p_now / p120)
 
-    rsi_window = [x for x in _BTC_SIGNAL_HISTORY if (now - x["t"]) <= 30]
+    # History is time-ordered, so the 30s/60s windows are suffixes; find their
+    # starts once and accumulate in place instead of filtering into lists.
+    i60 = n - 1
+    while i60 > h.start and (now - ts[i60 - 1]) <= 60:
+        i60 -= 1
+    i30 = n - 1
+    while i30 > i60 and (now - ts[i30 - 1]) <= 30:
+        i30 -= 1
+
     up = 0.0
     down = 0.0
-    for i in range(1, len(rsi_window)):
-        d = float(rsi_window[i]["p"]) - float(rsi_window[i - 1]["p"])
+    prev = px[i30]
+    for i in range(i30 + 1, n):
+        cur = px[i]
+        d = cur - prev
         if d > 0:
             up += d
         else:
             down += -d
+        prev = cur
     rsi = 50.0 if (up + down) <= 0 else (100.0 * up / (up + down))
     rsi_n = (rsi - 50.0) / 50.0
 
-    vol_window = [x for x in _BTC_SIGNAL_HISTORY if (now - x["t"]) <= 60]
-    rets = []
-    for i in range(1, len(vol_window)):
-        a = float(vol_window[i - 1]["p"])
-        b = float(vol_window[i]["p"])
-        if a > 0 and b > 0:
-            rets.append(math.log(b / a))
-    mean = (sum(rets) / len(rets)) if rets else 0.0
-    sigma = math.sqrt(sum((x - mean) ** 2 for x in rets) / len(rets)) if rets else 0.0001
-
-    last = _BTC_SIGNAL_HISTORY[-1]
-    cl = last.get("cl")
-    bi = last.get("bi")
+    k = 0
+    total = 0.0
+    prev = px[i60]
+    for i in range(i60 + 1, n):
+        cur = px[i]
+        if prev > 0 and cur > 0:
+            total += math.log(cur / prev)
+            k += 1
+        prev = cur
+    if k:
+        mean = total / k
+        sq = 0.0
+        prev = px[i60]
+        for i in range(i60 + 1, n):
+            cur = px[i]
+            if prev > 0 and cur > 0:
+                sq += (math.log(cur / prev) - mean) ** 2
+            prev = cur
+        sigma = math.sqrt(sq / k)
+    else:
+        sigma = 0.0001
+
+    cl = h.cl[-1]
+    bi = h.bi[-1]
     lead = ((float(bi) - float(cl)) / float(cl)) if (cl and bi and float(cl) > 0) else 0.0
     lead_bps = lead * 10000.0
 
@@ -364,11 +466,7 @@ def _compute_btc_signal() -> dict:
     return {"p_up": p_up, "lead_bps": lead_bps, "rf": rf, "rs": rs, "sigma": sigma, "rsi_n": rsi_n}
 
 
-def _bids_from_p(row: dict, p_up: float, margin: float = 0.006) -> tuple[Optional[float], Optional[float]]:
-    ay = float(row.get("best_ask_yes") or 0.0)
-    an = float(row.get("best_ask_no") or 0.0)
-    by = float(row.get("best_bid_yes") or 0.0)
-    bn = float(row.get("best_bid_no") or 0.0)
+def _bids_from_p(ay: float, an: float, by: float, bn: float, p_up: float, margin: float = 0.006) -> tuple[Optional[float], Optional[float]]:
     if ay <= 0 or an <= 0:
         return None, None
     jy = p_up - margin
@@ -383,6 +481,13 @@ def _bids_from_p(row: dict, p_up: float, margin: float = 0.006) -> tuple[Optiona
 
 
 def _model_weight(name: str) -> float:
+    w = _MODEL_WEIGHT_CACHE.get(name)
+    if w is None:
+        w = _MODEL_WEIGHT_CACHE[name] = _compute_model_weight(name)
+    return w
+
+
+def _compute_model_weight(name: str) -> float:
     s = _MODEL_STATS.get(name, {"trades": 0, "wins": 0, "pnl": 0.0})
     t = float(s.get("trades", 0) or 0)
     w = float(s.get("wins", 0) or 0)
@@ -465,10 +570,11 @@ def _model_compare(row: dict, signal: dict) -> dict:
     sn = max(0.0, an - bn) if an > 0 else 0.01
     p_bk = max(0.02, min(0.98, 0.5 + 0.12 * (sn - sy)))
 
-    ta = _bids_from_p(row, p_ta, 0.006)
-    ll = _bids_from_p(row, p_ll, 0.006)
-    rg = _bids_from_p(row, p_rg, 0.0065)
-    bk = _bids_from_p(row, p_bk, 0.006)
+    # Quotes are read once above and shared by all four models.
+    ta = _bids_from_p(ay, an, by, bn, p_ta, 0.006)
+    ll = _bids_from_p(ay, an, by, bn, p_ll, 0.006)
+    rg = _bids_from_p(ay, an, by, bn, p_rg, 0.0065)
+    bk = _bids_from_p(ay, an, by, bn, p_bk, 0.006)
 
     models = {"TA": ta, "LL": ll, "RG": rg, "BK": bk}
     probs = {
@@ -514,24 +620,31 @@ def _model_compare(row: dict, signal: dict) -> dict:
     }
 
 
-def _polymarket_btc_prices(event_start_iso: str, end_iso: str, variant: str = "fifteen") -> tuple[Optional[float], Optional[float]]:
-    if not event_start_iso:
-        return None, None
-    key = f"{event_start_iso}|{end_iso}|{variant}"
-    now = datetime.now(timezone.utc).timestamp()
-    cached = _BTC_PRICE_CACHE.get(key)
-    if cached:
-        open_px, current_px, ts = cached
-        age = now - float(ts or 0.0)
-        ttl = _BTC_PRICE_CACHE_TTL_OK if (open_px is not None) else _BTC_PRICE_CACHE_TTL_MISS
-        # Force at least one refresh per minute for rolling BTC windows.
-        if age <= min(ttl, _BTC_PRICE_FORCE_REFRESH_SECONDS):
-            return open_px, current_px
+def _ensure_btc_price_http() -> httpx.Client:
+    # Shared by the crypto-price lookups (and their prefetch threads) so the
+    # polymarket.com connection stays warm across cycles.
+    global _BTC_PRICE_HTTP
+    if _BTC_PRICE_HTTP is None:
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=60.0)
+        _BTC_PRICE_HTTP = httpx.Client(timeout=6.0, limits=limits)
+    return _BTC_PRICE_HTTP
+
+
+def _btc_price_cache_fresh(cached, now: float) -> bool:
+    if not cached:
+        return False
+    open_px, _, ts = cached
+    age = now - float(ts or 0.0)
+    ttl = _BTC_PRICE_CACHE_TTL_OK if (open_px is not None) else _BTC_PRICE_CACHE_TTL_MISS
+    # Force at least one refresh per minute for rolling BTC windows.
+    return age <= min(ttl, _BTC_PRICE_FORCE_REFRESH_SECONDS)
+
 
+def _fetch_polymarket_btc_prices(event_start_iso: str, end_iso: str, variant: str) -> tuple[Optional[float], Optional[float]]:
     open_px = None
     current_px = None
     try:
-        r = httpx.get(
+        r = _ensure_btc_price_http().get(
             "https://polymarket.com/api/crypto/crypto-price",
             params={
                 "symbol": "BTC",
@@ -539,7 +652,6 @@ def _polymarket_btc_prices(event_start_iso: str, end_iso: str, variant: str = "f
                 "endDate": end_iso,
                 "variant": variant,
             },
-            timeout=6.0,
         )
         if r.status_code == 200:
             obj = r.json()
@@ -551,12 +663,54 @@ def _polymarket_btc_prices(event_start_iso: str, end_iso: str, variant: str = "f
                     current_px = float(obj.get("closePrice"))
     except Exception:
         pass
+    return open_px, current_px
+
 
+def _store_btc_prices(key: str, open_px: Optional[float], current_px: Optional[float], now: float) -> tuple[Optional[float], Optional[float]]:
+    # A window's open price never changes, so a failed refresh keeps the known one.
+    if open_px is None:
+        cached = _BTC_PRICE_CACHE.get(key)
+        if cached:
+            open_px = cached[0]
     _BTC_PRICE_CACHE[key] = (open_px, current_px, now)
     return open_px, current_px
 
 
+def _polymarket_btc_prices(event_start_iso: str, end_iso: str, variant: str = "fifteen") -> tuple[Optional[float], Optional[float]]:
+    if not event_start_iso:
+        return None, None
+    key = f"{event_start_iso}|{end_iso}|{variant}"
+    now = datetime.now(timezone.utc).timestamp()
+    cached = _BTC_PRICE_CACHE.get(key)
+    if _btc_price_cache_fresh(cached, now):
+        return cached[0], cached[1]
+    open_px, current_px = _fetch_polymarket_btc_prices(event_start_iso, end_iso, variant)
+    return _store_btc_prices(key, open_px, current_px, now)
+
+
+def _prefetch_polymarket_btc_prices(windows: list[tuple[str, str]], variant: str = "fifteen"):
+    """Refresh stale crypto-price cache entries for ``windows`` concurrently.
+
+    Later _polymarket_btc_prices calls for the same windows then hit the cache
+    instead of paying one serial round-trip per BTC row.
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    todo = {}
+    for st, ed in windows:
+        key = f"{st}|{ed}|{variant}"
+        if st and key not in todo and not _btc_price_cache_fresh(_BTC_PRICE_CACHE.get(key), now):
+            todo[key] = (st, ed)
+    if len(todo) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(todo))) as pool:
+        results = list(pool.map(lambda w: _fetch_polymarket_btc_prices(w[0], w[1], variant), todo.values()))
+    for key, (open_px, current_px) in zip(todo, results):
+        _store_btc_prices(key, open_px, current_px, now)
+
+
+@lru_cache(maxsize=4096)
 def _topic_bucket(question: str, slug: str) -> str:
+    # Same markets come back every cycle, so each question/slug pair is classified once.
     q = (question or "").lower()
     s = (slug or "").lower()
     hay = q + " " + s
@@ -574,48 +728,57 @@ def _topic_bucket(question: str, slug: str) -> str:
 
 
 def run_once(cfg: dict):
-    global _GLOBAL_OPEN_PAUSE_UNTIL, _RECENT_FLIP_STOP_LOSS_TS
-    _ensure_btc_live_feed(cfg["storage"]["events_path"])
+    global _GLOBAL_OPEN_PAUSE_UNTIL, _RECENT_FLIP_STOP_LOSS_TS, _API_CALLS_TOTAL
+    events_path = cfg["storage"]["events_path"]
+    data_cfg = cfg["data"]
+    _ensure_btc_live_feed(events_path)
 
-    clob = ClobAdapter(cfg["data"]["clob_rest_base"])
-    gamma = GammaAdapter(cfg["data"]["gamma_base"])
+    clob = _ensure_clob(data_cfg["clob_rest_base"])
+    gamma = _ensure_gamma(data_cfg["gamma_base"])
     clob.reset_call_count()
     gamma.reset_call_count()
     state = load_state(cfg["storage"]["state_path"], float(cfg["paper"]["starting_cash_usd"]))
 
     snapshots = []
     try:
-        refs = gamma.fetch_active_market_refs(
-            limit=int(cfg["data"].get("max_markets", 10)),
-            focus_keywords=cfg["data"].get("focus_keywords", []),
-        )
-        slug_refs = gamma.fetch_market_refs_by_slugs(cfg["data"].get("focus_slugs", []))
-        prefixes = cfg["data"].get("focus_slug_prefixes", [])
-        prefix_refs = gamma.fetch_market_refs_by_slug_prefixes(
-            prefixes,
-            limit=max(200, int(cfg["data"].get("max_markets", 10)) * 10),
-            active_only=True,
-        )
-        # Slightly wider rolling window to reduce discovery gaps around 15m rollovers.
-        generated_refs_15m = gamma.fetch_market_refs_by_generated_15m_slugs(prefixes, windows=16)
-        generated_refs_5m = gamma.fetch_market_refs_by_generated_timeframe_slugs(
-            prefixes,
-            timeframe="5m",
-            bucket_seconds=300,
-            windows=24,
-            lookback_windows=24,
+        prefixes = data_cfg.get("focus_slug_prefixes", [])
+        # Discovery sources are independent; run them concurrently on the adapter's pooled async client.
+        refs, slug_refs, prefix_refs, generated_refs_15m, generated_refs_5m = gamma.gather(
+            gamma.afetch_active_market_refs(
+                limit=int(data_cfg.get("max_markets", 10)),
+                focus_keywords=data_cfg.get("focus_keywords", []),
+            ),
+            gamma.afetch_market_refs_by_slugs(data_cfg.get("focus_slugs", [])),
+            gamma.afetch_market_refs_by_slug_prefixes(
+                prefixes,
+                limit=max(200, int(data_cfg.get("max_markets", 10)) * 10),
+                active_only=True,
+            ),
+            # Slightly wider rolling window to reduce discovery gaps around 15m rollovers.
+            gamma.afetch_market_refs_by_generated_timeframe_slugs(
+                prefixes,
+                timeframe="15m",
+                bucket_seconds=900,
+                windows=16,
+                lookback_windows=8,
+            ),
+            gamma.afetch_market_refs_by_generated_timeframe_slugs(
+                prefixes,
+                timeframe="5m",
+                bucket_seconds=300,
+                windows=24,
+                lookback_windows=24,
+            ),
         )
-        generated_refs = generated_refs_15m + generated_refs_5m
-        by_id = {r.market_id: r for r in refs}
-        for r in slug_refs + prefix_refs + generated_refs:
-            by_id[r.market_id] = r
+        # Dedup by market_id: first sighting keeps its position, the latest source's ref wins.
+        by_id = {r.market_id: r for r in chain(refs, slug_refs, prefix_refs, generated_refs_15m, generated_refs_5m)}
         refs = list(by_id.values())
 
         # Rescue path: if focused discovery returns nothing, retry broad active markets
         # then keep only BTC/15m-ish names to avoid dead loop behavior.
         if not refs:
             broad = gamma.fetch_active_market_refs(
-                limit=max(300, int(cfg["data"].get("max_markets", 30)) * 20),
+                limit=max(300, int(data_cfg.get("max_markets", 30)) * 20),
                 focus_keywords=[],
             )
             hints = ["btc", "bitcoin", "up or down", "15m", "15 min", "15-minute"]
@@ -627,12 +790,13 @@ def run_once(cfg: dict):
         # and ranked by paired-leg arb proximity (YES ask + NO ask).
         global _ALT_REFS_CACHE, _ALT_REFS_TS
         now_ts = datetime.now(timezone.utc).timestamp()
-        refresh_secs = int(cfg.get("data", {}).get("alt_group_refresh_seconds", 300))
-        alt_target_n = int(cfg.get("data", {}).get("alt_group_size", 10))
-        alt_horizon_days = int(cfg.get("data", {}).get("alt_group_horizon_days", 30))
+        refresh_secs = int(data_cfg.get("alt_group_refresh_seconds", 300))
+        alt_target_n = int(data_cfg.get("alt_group_size", 10))
+        alt_horizon_days = int(data_cfg.get("alt_group_horizon_days", 30))
         if (now_ts - _ALT_REFS_TS) > refresh_secs or not _ALT_REFS_CACHE:
             broad = gamma.fetch_active_market_refs(limit=700, focus_keywords=[])
-            horizon = datetime.now(timezone.utc) + timedelta(days=alt_horizon_days)
+            now_dt = datetime.now(timezone.utc)
+            horizon = now_dt + timedelta(days=alt_horizon_days)
             cands = []
             for r in broad:
                 if _is_btc_ref(r):
@@ -642,7 +806,7 @@ def run_once(cfg: dict):
                     continue
                 if dt.tzinfo is None:
                     dt = dt.replace(tzinfo=timezone.utc)
-                if dt <= datetime.now(timezone.utc) or dt > horizon:
+                if dt <= now_dt or dt > horizon:
                     continue
                 cands.append(r)
             cands.sort(key=lambda x: float(getattr(x, "liquidity_num", 0.0)), reverse=True)
@@ -660,17 +824,17 @@ def run_once(cfg: dict):
                 active_only=False,
             )
             refs = fallback_refs[:3]
-            append_event(cfg["storage"]["events_path"], {
+            append_event(events_path, {
                 "type": "focus_fallback",
                 "reason": "no_active_focus_markets",
                 "selected_market_ids": [r.market_id for r in refs],
             })
 
         # Combine BTC group + secondary under-7d group, dedup by market_id.
-        by_mid = {r.market_id: r for r in (btc_refs + alt_refs)}
+        by_mid = {r.market_id: r for r in chain(btc_refs, alt_refs)}
         refs = list(by_mid.values())
 
-        use_ws = bool(cfg.get("data", {}).get("use_clob_ws", True))
+        use_ws = bool(data_cfg.get("use_clob_ws", True))
         ws_hook = None
         if use_ws:
             ws_hook = _ensure_ws_hook()
@@ -684,12 +848,15 @@ def run_once(cfg: dict):
                 }
                 for r in refs
             ])
+            # Ticks arrive on the WS thread; queue their events so the callback never waits on disk.
+            tick_sink = get_event_sink(events_path)
+
             def _on_ws_tick(tick: dict):
-                append_event(cfg["storage"]["events_path"], {"type": "ws_market_tick", **tick})
+                tick_sink.put({"type": "ws_market_tick", **tick})
                 s = tick.get("ask_sum_no_fees")
                 try:
                     if s is not None and float(s) <= 1.0:
-                        append_event(cfg["storage"]["events_path"], {
+                        tick_sink.put({
                             "type": "ws_opportunity_seen",
                             "count": 1,
                             "items": [
@@ -712,21 +879,24 @@ def run_once(cfg: dict):
         # WS override: replace best bid/ask with freshest websocket values when present.
         if use_ws and ws_hook:
             ws_updates = 0
+            # no token id for NO side in snapshot model; infer from refs map
+            no_token_by_market = {r.market_id: r.no_token for r in refs}
+            best = ws_hook.snapshot_best_all(chain(
+                (s.token_id for s in snapshots),
+                (no_token_by_market.get(s.market_id) or "" for s in snapshots),
+            ))
             for s in snapshots:
-                yb, ya = ws_hook.get_best(s.token_id)
+                yb, ya = best.get(s.token_id, (None, None))
                 if yb is not None and yb > 0:
                     s.yes_bid = yb
                     ws_updates += 1
                 if ya is not None and ya > 0:
                     s.yes_ask = ya
                     ws_updates += 1
-            # no token id for NO side in snapshot model; infer from refs map
-            no_token_by_market = {r.market_id: r.no_token for r in refs}
-            for s in snapshots:
                 nt = no_token_by_market.get(s.market_id)
                 if not nt:
                     continue
-                nb, na = ws_hook.get_best(nt)
+                nb, na = best.get(nt, (None, None))
                 if nb is not None and nb > 0:
                     s.no_bid = nb
                     ws_updates += 1
@@ -734,28 +904,28 @@ def run_once(cfg: dict):
                     s.no_ask = na
                     ws_updates += 1
 
-            append_event(cfg["storage"]["events_path"], {
+            append_event(events_path, {
                 "type": "ws_usage",
                 "enabled": True,
                 "updates_applied": ws_updates,
                 **ws_hook.stats(),
             })
     except Exception as e:
-        append_event(cfg["storage"]["events_path"], {"type": "adapter_error", "source": "gamma_clob", "error": str(e)})
+        append_event(events_path, {"type": "adapter_error", "source": "gamma_clob", "error": str(e)})
 
     if not snapshots:
-        if cfg["data"].get("focus_keywords"):
-            append_event(cfg["storage"]["events_path"], {
+        if data_cfg.get("focus_keywords"):
+            append_event(events_path, {
                 "type": "market_scan_empty",
                 "reason": "no_markets_for_focus_keywords",
-                "focus_keywords": cfg["data"].get("focus_keywords", []),
+                "focus_keywords": data_cfg.get("focus_keywords", []),
             })
             print("[yellow]No focused live markets found; skipping cycle.[/yellow]")
             return
         snapshots = clob.fetch_snapshots()  # demo fallback only when no focus filter
 
     ranked = rank_candidates(snapshots, cfg)
-    ops = score_opportunities(snapshots, cfg)
+    ops = score_opportunities(snapshots, cfg, ranked=ranked)
 
     fee_bps = float(cfg["scoring"]["fee_bps"])
     slippage_bps = float(cfg["scoring"]["slippage_bps"])
@@ -770,12 +940,44 @@ def run_once(cfg: dict):
         limit=8,
     )
     flow_watch = build_flow_watch(snapshots, limit=8)
-    append_event(cfg["storage"]["events_path"], {"type": "market_radar", "count": len(market_radar), "top": market_radar})
-    append_event(cfg["storage"]["events_path"], {"type": "inefficiency_report", "count": len(ineff), "top": ineff})
-    append_event(cfg["storage"]["events_path"], {"type": "flow_watch", "count": len(flow_watch), "top": flow_watch})
+    append_event(events_path, {"type": "market_radar", "count": len(market_radar), "top": market_radar})
+    append_event(events_path, {"type": "inefficiency_report", "count": len(ineff), "top": ineff})
+    append_event(events_path, {"type": "flow_watch", "count": len(flow_watch), "top": flow_watch})
 
-    snap_by_market = {s.market_id: s for s in snapshots}
-    question_by_market = {s.market_id: s.question for s in snapshots}
+    # One walk over the snapshots fills every per-market lookup used below.
+    snap_by_market = {}
+    question_by_market = {}
+    row_by_market = {}
+    cost_buffer = (fee_bps + slippage_bps) / 10000.0
+    for s in snapshots:
+        snap_by_market[s.market_id] = s
+        question_by_market[s.market_id] = s.question
+        yb, ya, nb, na = s.yes_bid, s.yes_ask, s.no_bid, s.no_ask
+        depth = float(s.depth_usd)
+        ask_sum_no_fees = ya + na
+        ask_sum_with_fees = ask_sum_no_fees + cost_buffer
+        if ask_sum_with_fees < 1.0:
+            signal = "OPPORTUNITY"
+        elif ask_sum_no_fees < 1.0:
+            signal = "WATCH"
+        else:
+            signal = "NO_OPPORTUNITY"
+        spread_penalty = (ya - yb) + (na - nb)
+        quality_score = (depth + 1.0) / max(spread_penalty + 0.01, 0.01)
+        row_by_market[s.market_id] = {
+            "market_id": s.market_id,
+            "market_name": s.question,
+            "best_bid_yes": round(yb, 4),
+            "best_bid_no": round(nb, 4),
+            "best_ask_yes": round(ya, 4),
+            "best_ask_no": round(na, 4),
+            "ask_sum_no_fees": round(ask_sum_no_fees, 4),
+            "ask_sum_with_fees": round(ask_sum_with_fees, 4),
+            "signal": signal,
+            "depth_usd": round(depth, 2),
+            "spread_sum": round(spread_penalty, 4),
+            "quality_score": round(quality_score, 2),
+        }
 
     top_payload = []
     min_edge = float(cfg["scoring"]["min_edge_bps"])
@@ -832,39 +1034,20 @@ def run_once(cfg: dict):
 
     # Build grouped monitor payloads: BTC first, then secondary (<7d non-BTC).
     btc_ids = {r.market_id for r in btc_refs}
-    alt_ids = {r.market_id for r in alt_refs if r.market_id not in btc_ids}
-
-    row_by_market = {}
-    for s in snapshots:
-        ask_sum_no_fees = s.yes_ask + s.no_ask
-        ask_sum_with_fees = ask_sum_no_fees + ((fee_bps + slippage_bps) / 10000.0)
-        if ask_sum_with_fees < 1.0:
-            signal = "OPPORTUNITY"
-        elif ask_sum_no_fees < 1.0:
-            signal = "WATCH"
-        else:
-            signal = "NO_OPPORTUNITY"
-        spread_penalty = (s.yes_ask - s.yes_bid) + (s.no_ask - s.no_bid)
-        quality_score = (float(s.depth_usd) + 1.0) / max(spread_penalty + 0.01, 0.01)
-        row_by_market[s.market_id] = {
-            "market_id": s.market_id,
-            "market_name": s.question,
-            "best_bid_yes": round(s.yes_bid, 4),
-            "best_bid_no": round(s.no_bid, 4),
-            "best_ask_yes": round(s.yes_ask, 4),
-            "best_ask_no": round(s.no_ask, 4),
-            "ask_sum_no_fees": round(ask_sum_no_fees, 4),
-            "ask_sum_with_fees": round(ask_sum_with_fees, 4),
-            "signal": signal,
-            "depth_usd": round(float(s.depth_usd), 2),
-            "spread_sum": round(spread_penalty, 4),
-            "quality_score": round(quality_score, 2),
-        }
+    alt_ids = set()
+    alt_ref_by_id = {}
+    for r in alt_refs:
+        alt_ref_by_id[r.market_id] = r
+        if r.market_id not in btc_ids:
+            alt_ids.add(r.market_id)
 
     # BTC group policy: always show the next 3 resolving BTC markets.
     now_dt = datetime.now(timezone.utc)
-    btc_ref_by_id = {r.market_id: r for r in btc_refs}
-    token_ids_by_market = {r.market_id: {"BUY_YES": r.yes_token, "BUY_NO": r.no_token} for r in btc_refs}
+    btc_ref_by_id = {}
+    token_ids_by_market = {}
+    for r in btc_refs:
+        btc_ref_by_id[r.market_id] = r
+        token_ids_by_market[r.market_id] = {"BUY_YES": r.yes_token, "BUY_NO": r.no_token}
     btc_candidates = []
     for mid in btc_ids:
         if mid not in row_by_market:
@@ -921,6 +1104,7 @@ def run_once(cfg: dict):
             btc_rows.append(rr)
 
     # BTC metadata from Polymarket crypto-price endpoint (Chainlink-derived in market UI).
+    btc_windows = []
     for r in btc_rows:
         rr = btc_ref_by_id.get(r.get("market_id"))
         src = getattr(rr, "resolution_source", "") if rr else ""
@@ -932,12 +1116,16 @@ def run_once(cfg: dict):
                 if _ed.tzinfo is None:
                     _ed = _ed.replace(tzinfo=timezone.utc)
                 st = (_ed - timedelta(minutes=15)).isoformat()
+        btc_windows.append((r, src, st, ed))
+    _prefetch_polymarket_btc_prices([(st, ed) for _, _, st, ed in btc_windows], variant="fifteen")
+    for r, src, st, ed in btc_windows:
         target_px, current_px = _polymarket_btc_prices(st, ed, variant="fifteen")
         chainlink_live, binance_live = _btc_live_prices()
         if current_px is None:
             current_px = chainlink_live if chainlink_live is not None else binance_live
 
         mid = str(r.get("market_id"))
+        row_now = datetime.now(timezone.utc)
         st_dt = _parse_dt(st) if st else None
         if st_dt is not None and st_dt.tzinfo is None:
             st_dt = st_dt.replace(tzinfo=timezone.utc)
@@ -945,7 +1133,7 @@ def run_once(cfg: dict):
         # Fallbacks for missing target: cached by market_id, or infer from BTC ticks near start.
         if target_px is None and mid in _BTC_TARGET_CACHE:
             target_px = _BTC_TARGET_CACHE[mid]
-        if target_px is None and st_dt is not None and datetime.now(timezone.utc) >= st_dt:
+        if target_px is None and st_dt is not None and row_now >= st_dt:
             inferred = _price_near_ts(st_dt.timestamp(), max_delta_s=1200.0)
             if inferred is not None:
                 target_px = inferred
@@ -958,11 +1146,11 @@ def run_once(cfg: dict):
         r["btc_price_source"] = src or "https://data.chain.link/streams/btc-usd"
         r["btc_target"] = round(target_px, 2) if target_px is not None else None
         if target_px is None:
-            now_ts = datetime.now(timezone.utc).timestamp()
+            now_ts = row_now.timestamp()
             prev_ts = float(_BTC_TARGET_MISS_LAST.get(mid) or 0.0)
             # Throttle noisy repeats while keeping visibility for real missing-target episodes.
             if now_ts - prev_ts >= 300.0:
-                append_event(cfg["storage"]["events_path"], {
+                append_event(events_path, {
                     "type": "btc_target_missing",
                     "market_id": r.get("market_id"),
                     "event_start_time": st,
@@ -1056,7 +1244,7 @@ def run_once(cfg: dict):
         })
 
     div_items.sort(key=lambda x: float(x.get("edge_est") or 0.0), reverse=True)
-    append_event(cfg["storage"]["events_path"], {
+    append_event(events_path, {
         "type": "timeframe_divergence",
         "enabled": True,
         "min_divergence": div_min,
@@ -1065,31 +1253,34 @@ def run_once(cfg: dict):
         "top": div_items[:5],
     })
 
-    alt_ref_by_id = {r.market_id: r for r in alt_refs}
     alt_rows = [row_by_market[m] for m in alt_ids if m in row_by_market]
 
     ws_metrics = {}
     if use_ws:
         try:
-            ws_metrics = _ensure_ws_hook().get_market_metrics(window_seconds=int(cfg.get("data", {}).get("alt_vol_window_seconds", 600)))
+            ws_metrics = _ensure_ws_hook().get_market_metrics(window_seconds=int(data_cfg.get("alt_vol_window_seconds", 600)))
         except Exception:
             ws_metrics = {}
 
-    min_tick_rate = float(cfg.get("data", {}).get("alt_min_updates_per_min", 3.0))
-    vol_weight = float(cfg.get("data", {}).get("alt_vol_weight", 0.60))
-    spread_cap = float(cfg.get("data", {}).get("alt_max_spread_sum", 0.12))
+    min_tick_rate = float(data_cfg.get("alt_min_updates_per_min", 3.0))
+    vol_weight = float(data_cfg.get("alt_vol_weight", 0.60))
+    spread_cap = float(data_cfg.get("alt_max_spread_sum", 0.12))
+    arb_weight = max(0.0, 0.75 - vol_weight)
+    alt_limit = int(data_cfg.get("alt_group_size", 10))
+    per_topic_cap = int(data_cfg.get("alt_group_topic_cap", 3))
 
     scored = []
-    for r in alt_rows:
-        mk = str(r.get("market_id", ""))
-        m = ws_metrics.get(mk, {})
-        updates = float(m.get("updates_per_min", 0.0))
-        vol = float(m.get("ask_volatility", 0.0))
+    # Nothing is shown when the group is disabled, so skip ranking altogether.
+    for r in (alt_rows if alt_limit > 0 else ()):
+        # Cheapest rejects first: spread is on the row, activity needs the WS metrics.
         spread = float(r.get("spread_sum", 9.0))
-        if updates < min_tick_rate:
-            continue
         if spread > spread_cap:
             continue
+        m = ws_metrics.get(str(r.get("market_id", "")))
+        updates = float(m.get("updates_per_min", 0.0)) if m else 0.0
+        if updates < min_tick_rate:
+            continue
+        vol = float(m.get("ask_volatility", 0.0)) if m else 0.0
 
         # lower is better for arb distance; convert to score.
         arb_dist = abs(float(r.get("ask_sum_no_fees", 9.0)) - 1.0)
@@ -1097,15 +1288,13 @@ def run_once(cfg: dict):
         vol_score = min(vol / 0.05, 1.0)
         activity_score = min(updates / 40.0, 1.0)
         # Volatility-first ranking, with activity second and arb proximity third.
-        composite = vol_weight * vol_score + 0.25 * activity_score + max(0.0, 0.75 - vol_weight) * arb_score
+        composite = vol_weight * vol_score + 0.25 * activity_score + arb_weight * arb_score
         scored.append((composite, updates, -arb_dist, r))
 
-    scored.sort(key=lambda t: (t[0], t[1], t[2]), reverse=True)
+    scored.sort(key=itemgetter(0, 1, 2), reverse=True)
     alt_rows = [x[3] for x in scored]
 
     # Diversity cap so one theme doesn't dominate the panel.
-    alt_limit = int(cfg.get("data", {}).get("alt_group_size", 10))
-    per_topic_cap = int(cfg.get("data", {}).get("alt_group_topic_cap", 3))
     if alt_limit <= 0:
         alt_rows = []
     else:
@@ -1123,7 +1312,7 @@ def run_once(cfg: dict):
         alt_rows = picked
 
     alt_enabled = alt_limit > 0
-    append_event(cfg["storage"]["events_path"], {
+    append_event(events_path, {
         "type": "market_groups",
         "bitcoin": btc_rows,
         "secondary": alt_rows,
@@ -1135,11 +1324,15 @@ def run_once(cfg: dict):
         "counts": {"bitcoin": len(btc_rows), "secondary": len(alt_rows)},
     })
 
-    append_event(cfg["storage"]["events_path"], {
+    cycle_calls = gamma.call_count + clob.call_count
+    _API_CALLS_TOTAL += cycle_calls
+    append_event(events_path, {
         "type": "api_usage",
         "gamma_calls": gamma.call_count,
         "clob_calls": clob.call_count,
-        "total_calls": gamma.call_count + clob.call_count,
+        "total_calls": cycle_calls,
+        # Monotonic for the life of the process, so readers can take the latest value.
+        "cumulative_calls": _API_CALLS_TOTAL,
         "snapshot_count": len(snapshots),
     })
 
@@ -1155,13 +1348,13 @@ def run_once(cfg: dict):
                 "ask_sum_no_fees": s0,
             })
 
-    append_event(cfg["storage"]["events_path"], {
+    append_event(events_path, {
         "type": "opportunity_seen",
         "count": len(opportunities_seen),
         "items": opportunities_seen,
     })
 
-    append_event(cfg["storage"]["events_path"], {
+    append_event(events_path, {
         "type": "market_scan",
         "snapshot_count": len(snapshots),
         "top_candidates": top_payload,
@@ -1284,7 +1477,8 @@ def run_once(cfg: dict):
         # Reversal only when model disagrees, target hit chance is weak, and winner is unstable.
         reversal_belief = ((winner_side == "BUY_YES" and p_yes < 0.42) or (winner_side == "BUY_NO" and p_yes > 0.58)) and (p_hit < 0.45) and (winner_stability < 0.65)
 
-        append_event(cfg["storage"]["events_path"], {
+        now_epoch = datetime.now(timezone.utc).timestamp()
+        append_event(events_path, {
             "type": "strategy_snapshot",
             "market_id": mid,
             "side": side,
@@ -1300,16 +1494,15 @@ def run_once(cfg: dict):
             "edge_no": edge_no,
             "open_positions": len(open_map),
             "flip_fail_streak": int(_FLIP_FAIL_STREAK.get(mid, 0) or 0),
-            "market_locked": bool(datetime.now(timezone.utc).timestamp() < float(_MARKET_LOCK_UNTIL.get(mid, 0.0) or 0.0)),
+            "market_locked": bool(now_epoch < float(_MARKET_LOCK_UNTIL.get(mid, 0.0) or 0.0)),
             "recent_losing_buy_no": bool(
                 str(_LAST_CLOSE_SIDE.get(mid, "") or "") == "BUY_NO"
                 and float(_LAST_CLOSE_PNL.get(mid, 0.0) or 0.0) <= 0
-                and (datetime.now(timezone.utc).timestamp() - float(_LAST_CLOSE_TS.get(mid, 0.0) or 0.0)) < 1800
+                and (now_epoch - float(_LAST_CLOSE_TS.get(mid, 0.0) or 0.0)) < 1800
             ),
         })
 
         # Open rule v3: trend-follow by default with persistence filter; reversal is rare.
-        now_epoch = datetime.now(timezone.utc).timestamp()
         last_close_ts = float(_LAST_CLOSE_TS.get(mid, 0.0))
         last_close_reason = str(_LAST_CLOSE_REASON.get(mid, "") or "")
         last_close_side = str(_LAST_CLOSE_SIDE.get(mid, "") or "")
@@ -1411,7 +1604,7 @@ def run_once(cfg: dict):
             model_tag = (f"SCALP:{impulse.get('source','src')}:{side}:{round(impulse_bps,1)}bps" if scalp_open_ok else best_model)
             entry_price_ok = (entry >= min_entry_price) and (entry <= max_entry_price)
             if (entry > 0) and (not entry_price_ok):
-                append_event(cfg["storage"]["events_path"], {
+                append_event(events_path, {
                     "type": "market_guardrail",
                     "market_id": mid,
                     "reason": "entry_price_out_of_bounds",
@@ -1436,7 +1629,7 @@ def run_once(cfg: dict):
                         size=float(qty),
                         post_only=open_exec in {"open_limit_fill", "open_limit_pending_skip"},
                     )
-                    append_event(cfg["storage"]["events_path"], {
+                    append_event(events_path, {
                         "type": "live_trade",
                         "action": "OPEN_SUBMIT",
                         "market_id": mid,
@@ -1466,7 +1659,7 @@ def run_once(cfg: dict):
                 pos.edge_entry = float(edge_yes if side == "BUY_YES" else edge_no)
                 pos.edge_peak = pos.edge_entry
                 open_map[mid] = pos
-                append_event(cfg["storage"]["events_path"], {
+                append_event(events_path, {
                     "type": "paper_trade",
                     "action": "OPEN",
                     "market_id": mid,
@@ -1569,7 +1762,7 @@ def run_once(cfg: dict):
                 else:
                     exit_price, execution_tag, close_fill_meta = _resolve_limit_close(open_pos, close_reason, order, cfg)
                     if exit_price is None:
-                        append_event(cfg["storage"]["events_path"], {
+                        append_event(events_path, {
                             "type": "paper_trade",
                             "action": "CLOSE_PENDING",
                             "reason": close_reason,
@@ -1596,7 +1789,7 @@ def run_once(cfg: dict):
                         size=float(qty_close),
                         post_only=(execution_tag in {"close_limit_fill"}),
                     )
-                    append_event(cfg["storage"]["events_path"], {
+                    append_event(events_path, {
                         "type": "live_trade",
                         "action": "CLOSE_SUBMIT" if close_frac >= 1.0 else "PARTIAL_CLOSE_SUBMIT",
                         "reason": close_reason,
@@ -1638,6 +1831,7 @@ def run_once(cfg: dict):
                         ms["trades"] = int(ms.get("trades", 0)) + 1
                         ms["wins"] = int(ms.get("wins", 0)) + (1 if pnl > 0 else 0)
                         ms["pnl"] = float(ms.get("pnl", 0.0)) + float(pnl)
+                        _MODEL_WEIGHT_CACHE.clear()
 
                     # Guardrail: lock a market after repeated wrong-way flip exits with non-positive outcomes.
                     streak = int(_FLIP_FAIL_STREAK.get(mid, 0) or 0)
@@ -1655,7 +1849,7 @@ def run_once(cfg: dict):
                             float(_MARKET_LOCK_UNTIL.get(mid, 0.0) or 0.0),
                             datetime.now(timezone.utc).timestamp() + lock_s,
                         )
-                        append_event(cfg["storage"]["events_path"], {
+                        append_event(events_path, {
                             "type": "market_guardrail",
                             "market_id": mid,
                             "reason": "single_flip_loss_cooloff",
@@ -1673,7 +1867,7 @@ def run_once(cfg: dict):
                             float(_MARKET_LOCK_UNTIL.get(mid, 0.0) or 0.0),
                             datetime.now(timezone.utc).timestamp() + lock_s,
                         )
-                        append_event(cfg["storage"]["events_path"], {
+                        append_event(events_path, {
                             "type": "market_guardrail",
                             "market_id": mid,
                             "reason": "single_hard_stop_cooloff",
@@ -1691,7 +1885,7 @@ def run_once(cfg: dict):
                             float(_MARKET_LOCK_UNTIL.get(mid, 0.0) or 0.0),
                             datetime.now(timezone.utc).timestamp() + lock_s,
                         )
-                        append_event(cfg["storage"]["events_path"], {
+                        append_event(events_path, {
                             "type": "market_guardrail",
                             "market_id": mid,
                             "reason": "flip_stop_loss_cooloff",
@@ -1715,7 +1909,7 @@ def run_once(cfg: dict):
                                     float(_GLOBAL_OPEN_PAUSE_UNTIL or 0.0),
                                     now_ts + float(global_flip_stop_pause_seconds),
                                 )
-                                append_event(cfg["storage"]["events_path"], {
+                                append_event(events_path, {
                                     "type": "market_guardrail",
                                     "market_id": "*",
                                     "reason": "global_flip_stop_cooloff",
@@ -1730,7 +1924,7 @@ def run_once(cfg: dict):
                     if streak >= 2:
                         lock_s = min(900, 300 + (streak - 2) * 180)
                         _MARKET_LOCK_UNTIL[mid] = datetime.now(timezone.utc).timestamp() + lock_s
-                        append_event(cfg["storage"]["events_path"], {
+                        append_event(events_path, {
                             "type": "market_guardrail",
                             "market_id": mid,
                             "reason": "flip_streak_lockout",
@@ -1741,7 +1935,7 @@ def run_once(cfg: dict):
                             "last_pnl_usd": round(float(pnl), 4),
                         })
 
-                append_event(cfg["storage"]["events_path"], {
+                append_event(events_path, {
                     "type": "paper_trade",
                     "action": "CLOSE" if close_frac >= 1.0 else "PARTIAL_CLOSE",
                     "reason": close_reason,
@@ -1763,7 +1957,7 @@ def run_once(cfg: dict):
                     "held_edge": round(held_edge, 4),
                     "opp_edge": round(opp_edge, 4),
                 })
-                append_event(cfg["storage"]["events_path"], {"type": "model_stats", "stats": _MODEL_STATS})
+                append_event(events_path, {"type": "model_stats", "stats": _MODEL_STATS})
                 print(f"[magenta]{'CLOSE' if close_frac>=1 else 'PARTIAL'}[/magenta] {mid} {open_pos.side} reason={close_reason} exec={execution_tag} pnl=${pnl:.2f}")
 
     save_state(cfg["storage"]["state_path"], state)
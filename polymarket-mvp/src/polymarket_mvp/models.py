@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
 
 class MarketSnapshot(BaseModel):
@@ -14,11 +14,14 @@ class MarketSnapshot(BaseModel):
     accepting_orders: bool = True
     yes_hint: float = 0.0
     no_hint: float = 0.0
-    yes_asks: List[dict] = Field(default_factory=list)
-    no_asks: List[dict] = Field(default_factory=list)
+    # Ask ladders as parsed (price, size) pairs, top 12 levels in book order.
+    yes_asks: List[Tuple[float, float]] = Field(default_factory=list)
+    no_asks: List[Tuple[float, float]] = Field(default_factory=list)
 
 
-class Opportunity(BaseModel):
+class Opportunity(NamedTuple):
+    # A plain tuple rather than a model: rank_candidates builds two per snapshot
+    # every cycle from values that are already typed.
     market_id: str
     side: str  # BUY_YES / BUY_NO
     edge_bps: float
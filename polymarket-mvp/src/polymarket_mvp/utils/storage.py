@@ -1,5 +1,10 @@
 from __future__ import annotations
+import atexit
 import json
+import os
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 from polymarket_mvp.models import RunState
@@ -25,3 +30,108 @@ def append_event(path: str, event: dict) -> None:
     event = {"ts": datetime.now(timezone.utc).isoformat(), **event}
     with p.open("a") as f:
         f.write(json.dumps(event) + "\n")
+
+
+class AsyncEventSink:
+    """Background JSONL appender: put() stamps and queues, a daemon thread writes.
+
+    Queued events are written in batches (up to ``max_batch`` lines, gathered for at
+    most ``linger`` seconds) with one write() each, on an O_APPEND descriptor that
+    stays open and is reopened if the file is replaced. Lines match append_event.
+    """
+
+    def __init__(self, path: str, max_batch: int = 256, linger: float = 0.01):
+        self.path = Path(path)
+        self.max_batch = max_batch
+        self.linger = linger
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._fd = None
+        self._thread = threading.Thread(target=self._run, name="event-sink", daemon=True)
+        self._thread.start()
+
+    def put(self, event: dict) -> None:
+        with self._cond:
+            self._pending += 1
+        self._q.put({"ts": datetime.now(timezone.utc).isoformat(), **event})
+
+    def flush(self, timeout: float = None) -> bool:
+        """Block until everything put() so far is written; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _write(self, data: bytes) -> None:
+        try:
+            st = os.stat(self.path)
+            if self._fd is not None and os.fstat(self._fd).st_ino != st.st_ino:
+                os.close(self._fd)
+                self._fd = None
+        except FileNotFoundError:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        if self._fd is None:
+            self._fd = self._open()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._q.get()]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    batch.append(self._q.get(timeout=left))
+                except queue.Empty:
+                    break
+            lines = []
+            for e in batch:
+                try:
+                    lines.append(json.dumps(e) + "\n")
+                except (TypeError, ValueError):
+                    try:
+                        lines.append(json.dumps(e, default=str) + "\n")
+                    except (TypeError, ValueError):
+                        pass
+            try:
+                self._write("".join(lines).encode())
+            except OSError:
+                # e.g. disk full: drop this batch rather than kill the writer.
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+            with self._cond:
+                self._pending -= len(batch)
+                if self._pending == 0:
+                    self._cond.notify_all()
+
+
+_SINKS_LOCK = threading.Lock()
+_SINKS: dict = {}
+
+
+def get_event_sink(path: str) -> AsyncEventSink:
+    """Process-wide AsyncEventSink for ``path``; flushed at interpreter exit."""
+    key = str(Path(path).resolve())
+    with _SINKS_LOCK:
+        sink = _SINKS.get(key)
+        if sink is None:
+            sink = _SINKS[key] = AsyncEventSink(path)
+        return sink
+
+
+@atexit.register
+def _flush_event_sinks() -> None:
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+    for sink in sinks:
+        sink.flush(timeout=2.0)
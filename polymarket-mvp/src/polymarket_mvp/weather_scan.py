@@ -7,9 +7,8 @@ from polymarket_mvp.utils.storage import append_event
 
 def run(config_path: str = "config/default.yaml"):
     cfg = load_config(config_path)
-    gamma = GammaAdapter(cfg["data"]["gamma_base"])
-
-    refs = gamma.fetch_active_market_refs(limit=400)
+    with GammaAdapter(cfg["data"]["gamma_base"]) as gamma:
+        refs = gamma.fetch_active_market_refs(limit=400)
     wx = re.compile(r"\b(temp|temperature|forecast|weather|rain|snow|hurricane|tornado|storm|climate|hottest|gust|precip)\b", re.I)
     sports_noise = re.compile(r"\b(nba|nhl|nfl|mlb|fifa|cup|stanley|heat|hurricanes?|bundesliga|goal scorer|finals?)\b", re.I)
     refs = [r for r in refs if wx.search(r.question) and not sports_noise.search(r.question)]
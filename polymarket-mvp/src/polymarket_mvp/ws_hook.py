@@ -14,6 +14,8 @@ class ClobWsHook:
         self._asset_ids = set()
         self._best: Dict[str, Dict[str, float]] = {}
         self._last_msg_ts = 0.0
+        # Monotonic twin of _last_msg_ts for wait_for_update, immune to wall-clock steps.
+        self._last_msg_mono = 0.0
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock)
         self._thread: Optional[threading.Thread] = None
@@ -51,6 +53,17 @@ class ClobWsHook:
                 return None, None
             return row.get("bid"), row.get("ask")
 
+    def snapshot_best_all(self, asset_ids: Iterable[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """(bid, ask) for each tracked id in ``asset_ids``, read under one lock acquisition."""
+        out: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        with self._lock:
+            best = self._best
+            for a in asset_ids:
+                row = best.get(str(a))
+                if row:
+                    out[a] = (row.get("bid"), row.get("ask"))
+        return out
+
     def set_on_tick(self, cb: Optional[Callable[[dict], None]]):
         self._on_tick = cb
 
@@ -87,12 +100,18 @@ class ClobWsHook:
                 "alive": self._running,
             }
 
+    def last_update(self) -> float:
+        """time.monotonic() of the last applied message (0.0 before the first)."""
+        with self._lock:
+            return self._last_msg_mono
+
     def wait_for_update(self, after_ts: float, timeout: float = 1.0) -> float:
+        # after_ts and the return value are last_update() stamps.
         with self._cond:
-            if self._last_msg_ts > float(after_ts):
-                return self._last_msg_ts
+            if self._last_msg_mono > float(after_ts):
+                return self._last_msg_mono
             self._cond.wait(timeout=max(0.05, float(timeout)))
-            return self._last_msg_ts
+            return self._last_msg_mono
 
     def get_market_metrics(self, window_seconds: int = 600) -> Dict[str, dict]:
         now = time.time()
@@ -186,11 +205,18 @@ class ClobWsHook:
         except Exception:
             return
 
-        with self._cond:
-            self._last_msg_ts = time.time()
-            self._cond.notify_all()
-
         items = obj if isinstance(obj, list) else [obj]
+        try:
+            self._apply(items)
+        finally:
+            # Wake wait_for_update only once the message's books are stored, so the
+            # woken cycle reads them rather than the previous quotes.
+            with self._cond:
+                self._last_msg_ts = time.time()
+                self._last_msg_mono = time.monotonic()
+                self._cond.notify_all()
+
+    def _apply(self, items: list):
         for it in items:
             if not isinstance(it, dict):
                 continue